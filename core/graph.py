@@ -15,6 +15,7 @@ import asyncio
 import re
 import logging
 from abc import ABC, abstractmethod
+from collections import OrderedDict
 
 # 경로 설정
 current_dir = os.path.dirname(os.path.abspath(__file__))
@@ -27,10 +28,25 @@ from langgraph.graph import StateGraph, START, END
 # from core.hybrid_decision import SimplifiedHybridDecisionEngine
 
 from .state import VictimRecoveryState, create_initial_recovery_state
-from .hybrid_decision import SimplifiedHybridDecisionEngine
+from .hybrid_decision import get_engine
 
 logger = logging.getLogger(__name__)
 
+# 음성 인식 오류 교정 (한 번의 정규식 스캔으로 모두 치환)
+_VOICE_CORRECTIONS = {
+    "일삼이": "132",
+    "일팔일일": "1811",
+    "보이스비싱": "보이스피싱",
+    "명의 도용": "명의도용"
+}
+_VOICE_CORRECTION_PATTERN = re.compile("|".join(map(re.escape, _VOICE_CORRECTIONS)))
+
+# Gemini 응답 캐시 크기 (같은 질문 반복 시 API 호출 생략)
+_GEMINI_RESPONSE_CACHE_SIZE = 128
+# 캐시 키에 포함할 문맥 항목 (같은 말이라도 단계/모드/직전 답변이 다르면 다른 응답)
+# conversation_turns는 매 턴 증가해 키가 매번 달라지므로 제외
+_GEMINI_CACHE_CONTEXT_KEYS = ("current_step", "current_mode", "urgency_level", "last_ai_response")
+
 # ============================================================================
 # 인터페이스 정의 (SOLID - 인터페이스 분리 원칙)
 # ============================================================================
@@ -280,8 +296,12 @@ class PersonalizedConsultationStrategy:
         self.conversation_turns = 0
         self.user_situation = {}
         
-        # (중요!) 하이브리드 의사결정 엔진을 여기서 생성하고 사용합니다.
-        self.decision_engine = SimplifiedHybridDecisionEngine(debug=True)
+        # (중요!) 하이브리드 의사결정 엔진은 프로세스 공용 인스턴스를 사용합니다 (판단 캐시 공유).
+        self.decision_engine = get_engine(debug=True)
+        
+        # Gemini 응답 LRU 캐시 ((문맥, 정규화된 입력) → 최종 응답 문자열)
+        self._gemini_cache: "OrderedDict[tuple, str]" = OrderedDict()
+        self.cache_hits = 0
         
         self.situation_patterns = {
             "prevention": {
@@ -338,6 +358,18 @@ class PersonalizedConsultationStrategy:
     
     async def _get_gemini_response(self, user_input: str, context: Dict[str, Any]) -> str:
         """Gemini 응답 생성"""
+        # 같은 단계/문맥의 같은 질문은 캐시된 응답 재사용 (대화 상태 전이는 호출 측에서 그대로 진행됨)
+        ctx = context or {}
+        cache_key = (
+            *(ctx.get(key) for key in _GEMINI_CACHE_CONTEXT_KEYS),
+            " ".join(user_input.lower().split()),
+        )
+        cached = self._gemini_cache.get(cache_key)
+        if cached is not None:
+            self._gemini_cache.move_to_end(cache_key)
+            self.cache_hits += 1
+            return cached
+        
         try:
             from services.gemini_assistant import gemini_assistant
             
@@ -361,16 +393,26 @@ class PersonalizedConsultationStrategy:
 
             if response_text and suggestion_text:
                 # 추천 질문이 있다면, 자연스럽게 안내 문구를 추가합니다.
-                return f"{response_text}\n\n다음으로는 '{suggestion_text}'에 대해 물어보실 수 있어요."
+                return self._cache_gemini_response(
+                    cache_key,
+                    f"{response_text}\n\n다음으로는 '{suggestion_text}'에 대해 물어보실 수 있어요."
+                )
             elif response_text:
                 # 답변만 있다면 답변만 반환합니다.
-                return response_text
+                return self._cache_gemini_response(cache_key, response_text)
             
         except Exception as e:
             logger.warning(f"Gemini 처리 실패: {e}")
         
         return self._get_rule_based_response(user_input)
     
+    def _cache_gemini_response(self, cache_key: tuple, response: str) -> str:
+        """Gemini 응답 캐시 저장 (실패/폴백 응답은 저장하지 않음)"""
+        self._gemini_cache[cache_key] = response
+        if len(self._gemini_cache) > _GEMINI_RESPONSE_CACHE_SIZE:
+            self._gemini_cache.popitem(last=False)
+        return response
+    
     def is_complete(self) -> bool:
         """대화 완료 여부"""
         return self.conversation_turns >= 8
@@ -497,6 +539,7 @@ class VoiceFriendlyPhishingGraph:
         context = {
             "urgency_level": 5,
             "conversation_turns": getattr(self.consultation_strategy, 'conversation_turns', 0),
+            "current_step": self.current_state.get("current_step") if self.current_state else None,
             "last_ai_response": last_ai_message # Gemini에게 이전 답변을 알려줍니다.
         }
         
@@ -698,6 +741,7 @@ class VoiceFriendlyPhishingGraph:
             try:
                 context = {
                     "conversation_turns": state.get("conversation_turns", 0),
+                    "current_step": state.get("current_step"),
                     "current_mode": "assessment"
                 }
                 
@@ -762,6 +806,7 @@ class VoiceFriendlyPhishingGraph:
                 context = {
                     "conversation_turns": state.get("conversation_turns", 0),
                     "urgency_level": state.get("urgency_level", 5),
+                    "current_step": state.get("current_step"),
                     "current_mode": "consultation"
                 }
                 
@@ -950,18 +995,7 @@ class VoiceFriendlyPhishingGraph:
             return ""
         
         # 음성 인식 오류 교정
-        corrections = {
-            "일삼이": "132",
-            "일팔일일": "1811",
-            "보이스비싱": "보이스피싱",
-            "명의 도용": "명의도용"
-        }
-        
-        processed = text.strip()
-        for wrong, correct in corrections.items():
-            processed = processed.replace(wrong, correct)
-        
-        return processed
+        return _VOICE_CORRECTION_PATTERN.sub(lambda m: _VOICE_CORRECTIONS[m.group(0)], text.strip())
     
     def _get_mode_selection_message(self) -> str:
         """모드 선택 메시지"""
@@ -1052,16 +1086,26 @@ class VoiceFriendlyPhishingGraph:
         
         state["conversation_turns"] = state.get("conversation_turns", 0) + 1
         
+        # 🚨 응급 상황은 의사결정 엔진/Gemini 이전에 즉시 처리
+        urgency = self.emergency_handler.detect_emergency(user_input)
+        if urgency >= 9:
+            state["is_emergency"] = True
+            state["urgency_level"] = urgency
+            state["messages"].append({
+                "role": "assistant",
+                "content": self.emergency_handler.get_emergency_response(urgency),
+                "timestamp": datetime.now()
+            })
+            
+            if self.debug:
+                print(f"🚨 응급 상황 즉시 처리 (응급도 {urgency})")
+            
+            return state
+        
         try:
             # 현재 단계에 따른 처리
             current_step = state.get("current_step", "greeting_complete")
             
-            # 응급 상황 체크
-            urgency = self.emergency_handler.detect_emergency(user_input)
-            if urgency >= 9:
-                state = self._emergency_node(state)
-                return state
-            
             # 모드별 처리
             if current_step == "greeting_complete":
                 mode = self._detect_mode_selection(user_input)
@@ -1074,7 +1118,7 @@ class VoiceFriendlyPhishingGraph:
                 elif mode == "consultation":
                     self.conversation_mode = "consultation"
                     # 상담 시작
-                    context = {"urgency_level": urgency, "conversation_turns": state["conversation_turns"]}
+                    context = {"urgency_level": urgency, "conversation_turns": state["conversation_turns"], "current_step": current_step}
                     response = await self.consultation_strategy.process_input(user_input, context)
                     state["current_step"] = "consultation"
                 else:
@@ -1111,7 +1155,7 @@ class VoiceFriendlyPhishingGraph:
             
             elif current_step == "consultation":
                 # 상담 계속
-                context = {"urgency_level": urgency, "conversation_turns": state["conversation_turns"]}
+                context = {"urgency_level": urgency, "conversation_turns": state["conversation_turns"], "current_step": current_step}
                 response = await self.consultation_strategy.process_input(user_input, context)
                 
                 # 응답 길이 제한
@@ -1213,7 +1257,8 @@ class VoiceFriendlyPhishingGraph:
             "current_step": state.get("current_step", "unknown"),
             "assessment_complete": self.victim_assessment.is_complete() if self.conversation_mode == "assessment" else None,
             "consultation_complete": self.consultation_strategy.is_complete() if self.conversation_mode == "consultation" else None,
-            "completion_status": state.get("current_step") == "consultation_complete"
+            "completion_status": state.get("current_step") == "consultation_complete",
+            "gemini_cache_hits": self.consultation_strategy.cache_hits
         }
     
     async def cleanup(self):
@@ -8,18 +8,29 @@
 
 import asyncio
 import logging
-from datetime import datetime
-from typing import Dict, Any, List, Literal
+import uuid
+from collections import OrderedDict
+from typing import Dict, Any, List, Literal, Optional, Union
 from langgraph.graph import StateGraph, START, END
 from langgraph.prebuilt import ToolNode
+from langgraph.checkpoint.memory import MemorySaver
+from langgraph.cache.memory import InMemoryCache
+from langgraph.types import CachePolicy
 from langchain_core.tools import tool
-from langchain_core.messages import HumanMessage, AIMessage
+from langgraph.graph.message import REMOVE_ALL_MESSAGES
+from langchain_core.messages import HumanMessage, AIMessage, RemoveMessage
 
 from core.state import VictimRecoveryState, create_initial_recovery_state
 from config.settings import settings
 
 logger = logging.getLogger(__name__)
 
+# 메시지 압축 정책: 임계치 초과 시 최근 K개 + 요약 메시지 1개만 유지
+_COMPACT_THRESHOLD = 20
+_COMPACT_KEEP_RECENT = 10
+_SUMMARY_MESSAGE_ID = "conversation_summary"
+_SUMMARY_CACHE_SIZE = 8  # 요약 캐시 LRU 크기 (같은 구간 재요약 방지)
+
 # ============================================================================
 # TOOLS: 외부 기능들을 도구로 분리
 # ============================================================================
@@ -56,21 +67,23 @@ async def emergency_detector_tool(user_input: str) -> Dict[str, Any]:
         "is_emergency": urgency >= 8
     }
 
+# 체크리스트 질문 (라우터가 도구 호출 없이 완료 여부를 판단할 수 있도록 모듈 상수로 유지)
+_ASSESSMENT_CHECKLIST = (
+    "본인이 피해자인가요? 네 또는 아니요로 답해주세요.",
+    "지금도 계속 연락이 오고 있나요? 네 또는 아니요로 답해주세요.",
+    "돈을 보내셨나요? 네 또는 아니요로 답해주세요.",
+    "계좌지급정지 신청하셨나요? 네 또는 아니요로 답해주세요.",
+    "112 신고하셨나요? 네 또는 아니요로 답해주세요.",
+    "PASS 앱 설치되어 있나요? 네 또는 아니요로 답해주세요."
+)
+_CHECKLIST_LEN = len(_ASSESSMENT_CHECKLIST)
+
 @tool
 async def assessment_question_generator_tool(step: int) -> Dict[str, Any]:
     """체크리스트 질문 생성 도구"""
-    checklist = [
-        "본인이 피해자인가요? 네 또는 아니요로 답해주세요.",
-        "지금도 계속 연락이 오고 있나요? 네 또는 아니요로 답해주세요.",
-        "돈을 보내셨나요? 네 또는 아니요로 답해주세요.",
-        "계좌지급정지 신청하셨나요? 네 또는 아니요로 답해주세요.",
-        "112 신고하셨나요? 네 또는 아니요로 답해주세요.",
-        "PASS 앱 설치되어 있나요? 네 또는 아니요로 답해주세요."
-    ]
-    
-    if step < len(checklist):
+    if step < _CHECKLIST_LEN:
         return {
-            "question": checklist[step],
+            "question": _ASSESSMENT_CHECKLIST[step],
             "step": step,
             "is_complete": False
         }
@@ -180,10 +193,10 @@ async def rule_based_responder_tool(user_input: str) -> Dict[str, Any]:
 async def hybrid_decision_tool(user_input: str, context: Dict[str, Any]) -> Dict[str, Any]:
     """하이브리드 의사결정 도구"""
     try:
-        from core.hybrid_decision import SimplifiedHybridDecisionEngine
+        from core.hybrid_decision import get_engine
         
-        engine = SimplifiedHybridDecisionEngine(debug=False)
-        decision = engine.should_use_gemini(user_input, context)
+        # 호출마다 엔진을 만들지 않고 공용 엔진 재사용 (반복 입력은 판단 캐시 적중)
+        decision = get_engine().should_use_gemini(user_input, context)
         
         return {
             "use_gemini": decision.get("use_gemini", False),
@@ -223,24 +236,29 @@ async def tts_delivery_tool(text: str) -> Dict[str, Any]:
 # NODES: 각 처리 단계를 독립적 함수로
 # ============================================================================
 
-async def greeting_node(state: VictimRecoveryState) -> VictimRecoveryState:
-    """인사 노드 - 초기 모드 선택 안내"""
-    greeting_message = """안녕하세요. 보이스피싱 상담센터입니다.
+# 고정 안내 문구 (세션마다 동일)
+_GREETING_MESSAGE = """안녕하세요. 보이스피싱 상담센터입니다.
 1번은 피해 상황 체크리스트 (단계별 확인)
 2번은 맞춤형 상담 (상황에 맞는 조치)
 1번 또는 2번이라고 말씀해주세요."""
-    
+
+_FAREWELL_MESSAGE = "상담이 완료되었습니다. 추가 도움이 필요하시면 132번으로 연락하세요."
+
+async def greeting_node(state: VictimRecoveryState) -> Dict[str, Any]:
+    """인사 노드 - 초기 모드 선택 안내"""
     # TTS 전달
-    await tts_delivery_tool.ainvoke({"text": greeting_message})
-    
-    # 상태 업데이트
-    state["messages"].append(AIMessage(content=greeting_message))
-    state["current_step"] = "greeting_complete"
+    await tts_delivery_tool.ainvoke({"text": _GREETING_MESSAGE})
     
-    return state
+    # 상태 업데이트 (새 메시지만 반환 - add_messages 리듀서가 병합)
+    # AIMessage는 매번 새로 생성: add_messages가 id를 부여하므로 공유 객체면 재인사가 기존 메시지를 덮어씀
+    return {
+        "messages": [AIMessage(content=_GREETING_MESSAGE)],
+        "last_ai_response": _GREETING_MESSAGE,
+        "current_step": "greeting_complete"
+    }
 
-async def mode_detection_node(state: VictimRecoveryState) -> VictimRecoveryState:
-    """모드 감지 노드"""
+async def mode_detection_node(state: VictimRecoveryState) -> Dict[str, Any]:
+    """모드 감지 노드 (입력만으로 결정되는 순수 분류기 - 변경분만 반환하므로 캐시 가능)"""
     last_message = state["messages"][-1] if state["messages"] else None
     user_input = last_message.content if isinstance(last_message, HumanMessage) else ""
     
@@ -254,12 +272,16 @@ async def mode_detection_node(state: VictimRecoveryState) -> VictimRecoveryState
     else:
         detected_mode = "unknown"
     
-    state["conversation_mode"] = detected_mode
-    state["current_step"] = "mode_detected"
-    
-    return state
+    return {
+        "conversation_mode": detected_mode,
+        "current_step": "mode_detected"
+    }
 
-async def emergency_detection_node(state: VictimRecoveryState) -> VictimRecoveryState:
+def _last_message_cache_key(state: VictimRecoveryState) -> str:
+    """노드 캐시 키 - 마지막 메시지 내용"""
+    return state["messages"][-1].content if state["messages"] else ""
+
+async def emergency_detection_node(state: VictimRecoveryState) -> Dict[str, Any]:
     """응급 상황 감지 노드"""
     last_message = state["messages"][-1] if state["messages"] else None
     user_input = last_message.content if isinstance(last_message, HumanMessage) else ""
@@ -267,19 +289,20 @@ async def emergency_detection_node(state: VictimRecoveryState) -> VictimRecovery
     # 응급 상황 감지
     emergency_result = await emergency_detector_tool.ainvoke({"user_input": user_input})
     
-    state["urgency_level"] = emergency_result["urgency"]
+    updates = {"urgency_level": emergency_result["urgency"]}
     
     if emergency_result["is_emergency"]:
         # 즉시 응급 응답
         await tts_delivery_tool.ainvoke({"text": emergency_result["emergency_response"]})
         
-        state["messages"].append(AIMessage(content=emergency_result["emergency_response"]))
-        state["current_step"] = "emergency_handled"
+        updates["messages"] = [AIMessage(content=emergency_result["emergency_response"])]
+        updates["last_ai_response"] = emergency_result["emergency_response"]
+        updates["current_step"] = "emergency_handled"
     
-    return state
+    return updates
 
-async def assessment_question_node(state: VictimRecoveryState) -> VictimRecoveryState:
-    """평가 질문 노드"""
+async def assessment_question_node(state: VictimRecoveryState) -> Dict[str, Any]:
+    """평가 질문 노드 (decision_probe와 병렬 실행되므로 변경분만 반환)"""
     current_step = state.get("assessment_step", 0)
     
     # 질문 생성
@@ -291,22 +314,41 @@ async def assessment_question_node(state: VictimRecoveryState) -> VictimRecovery
         # TTS 전달
         await tts_delivery_tool.ainvoke({"text": question})
         
-        # 상태 업데이트
-        state["messages"].append(AIMessage(content=question))
-        state["current_step"] = "assessment_waiting"
-    else:
-        # 평가 완료
-        state["current_step"] = "assessment_complete"
+        return {
+            "messages": [AIMessage(content=question)],
+            "last_ai_response": question,
+            "current_step": "assessment_waiting"
+        }
     
-    return state
+    # 평가 완료
+    return {"current_step": "assessment_complete"}
 
-async def assessment_answer_node(state: VictimRecoveryState) -> VictimRecoveryState:
+async def decision_probe_node(state: VictimRecoveryState) -> Dict[str, Any]:
+    """의사결정 선행 노드 - 평가 질문과 같은 super-step에서 하이브리드 판단을 미리 수행"""
+    last_message = state["messages"][-1] if state["messages"] else None
+    user_input = last_message.content if isinstance(last_message, HumanMessage) else ""
+    
+    context = {
+        "conversation_turns": state.get("conversation_turns", 0),
+        "urgency_level": state.get("urgency_level", 5),
+        "last_ai_response": state.get("last_ai_response", "")
+    }
+    
+    decision = await hybrid_decision_tool.ainvoke({
+        "user_input": user_input,
+        "context": context
+    })
+    
+    # 어느 턴의 판단인지 함께 기록 (ai_decision 노드에서 재사용 여부 확인용)
+    return {"decision_probe": {"turn": context["conversation_turns"], **decision}}
+
+async def assessment_answer_node(state: VictimRecoveryState) -> Dict[str, Any]:
     """평가 답변 처리 노드"""
     last_message = state["messages"][-1] if state["messages"] else None
     user_input = last_message.content if isinstance(last_message, HumanMessage) else ""
     
     current_step = state.get("assessment_step", 0)
-    responses = state.get("assessment_responses", {})
+    responses = dict(state.get("assessment_responses") or {})
     
     # 답변 처리
     answer_result = await assessment_answer_processor_tool.ainvoke({
@@ -316,45 +358,54 @@ async def assessment_answer_node(state: VictimRecoveryState) -> VictimRecoverySt
     })
     
     # 상태 업데이트
-    state["assessment_step"] = answer_result["next_step"]
-    state["assessment_responses"] = answer_result["responses"]
+    updates = {
+        "assessment_step": answer_result["next_step"],
+        "assessment_responses": answer_result["responses"]
+    }
     
     # 즉시 조치 필요시
     if answer_result["immediate_action"]:
         await tts_delivery_tool.ainvoke({"text": answer_result["immediate_action"]})
-        state["messages"].append(AIMessage(content=answer_result["immediate_action"]))
+        updates["messages"] = [AIMessage(content=answer_result["immediate_action"])]
+        updates["last_ai_response"] = answer_result["immediate_action"]
     
-    return state
+    return updates
 
-async def ai_decision_node(state: VictimRecoveryState) -> VictimRecoveryState:
+async def ai_decision_node(state: VictimRecoveryState) -> Dict[str, Any]:
     """AI vs 룰 기반 결정 노드"""
     last_message = state["messages"][-1] if state["messages"] else None
     user_input = last_message.content if isinstance(last_message, HumanMessage) else ""
     
     context = {
         "conversation_turns": state.get("conversation_turns", 0),
-        "urgency_level": state.get("urgency_level", 5)
+        "urgency_level": state.get("urgency_level", 5),
+        "last_ai_response": state.get("last_ai_response", "")
     }
     
-    # 하이브리드 결정
-    decision = await hybrid_decision_tool.ainvoke({
-        "user_input": user_input,
-        "context": context
-    })
-    
-    state["use_ai_response"] = decision["use_gemini"]
-    state["decision_confidence"] = decision["confidence"]
+    # 하이브리드 결정 (이번 턴에 decision_probe가 이미 판단했다면 재사용)
+    probe = state.get("decision_probe") or {}
+    if probe.get("turn") == context["conversation_turns"]:
+        decision = probe
+    else:
+        decision = await hybrid_decision_tool.ainvoke({
+            "user_input": user_input,
+            "context": context
+        })
     
-    return state
+    return {
+        "use_ai_response": decision["use_gemini"],
+        "decision_confidence": decision["confidence"]
+    }
 
-async def ai_consultation_node(state: VictimRecoveryState) -> VictimRecoveryState:
+async def ai_consultation_node(state: VictimRecoveryState) -> Dict[str, Any]:
     """AI 상담 노드"""
     last_message = state["messages"][-1] if state["messages"] else None
     user_input = last_message.content if isinstance(last_message, HumanMessage) else ""
     
     context = {
         "conversation_turns": state.get("conversation_turns", 0),
-        "urgency_level": state.get("urgency_level", 5)
+        "urgency_level": state.get("urgency_level", 5),
+        "last_ai_response": state.get("last_ai_response", "")
     }
     
     # Gemini AI 호출
@@ -378,12 +429,13 @@ async def ai_consultation_node(state: VictimRecoveryState) -> VictimRecoveryStat
     await tts_delivery_tool.ainvoke({"text": response})
     
     # 상태 업데이트
-    state["messages"].append(AIMessage(content=response))
-    state["current_step"] = "consultation"
-    
-    return state
+    return {
+        "messages": [AIMessage(content=response)],
+        "last_ai_response": response,
+        "current_step": "consultation"
+    }
 
-async def rule_consultation_node(state: VictimRecoveryState) -> VictimRecoveryState:
+async def rule_consultation_node(state: VictimRecoveryState) -> Dict[str, Any]:
     """룰 기반 상담 노드"""
     last_message = state["messages"][-1] if state["messages"] else None
     user_input = last_message.content if isinstance(last_message, HumanMessage) else ""
@@ -396,23 +448,23 @@ async def rule_consultation_node(state: VictimRecoveryState) -> VictimRecoverySt
     await tts_delivery_tool.ainvoke({"text": response})
     
     # 상태 업데이트
-    state["messages"].append(AIMessage(content=response))
-    state["current_step"] = "consultation"
-    
-    return state
+    return {
+        "messages": [AIMessage(content=response)],
+        "last_ai_response": response,
+        "current_step": "consultation"
+    }
 
-async def conversation_complete_node(state: VictimRecoveryState) -> VictimRecoveryState:
+async def conversation_complete_node(state: VictimRecoveryState) -> Dict[str, Any]:
     """대화 완료 노드"""
-    farewell = "상담이 완료되었습니다. 추가 도움이 필요하시면 132번으로 연락하세요."
-    
     # TTS 전달
-    await tts_delivery_tool.ainvoke({"text": farewell})
+    await tts_delivery_tool.ainvoke({"text": _FAREWELL_MESSAGE})
     
     # 상태 업데이트
-    state["messages"].append(AIMessage(content=farewell))
-    state["current_step"] = "conversation_complete"
-    
-    return state
+    return {
+        "messages": [AIMessage(content=_FAREWELL_MESSAGE)],
+        "last_ai_response": _FAREWELL_MESSAGE,
+        "current_step": "conversation_complete"
+    }
 
 # ============================================================================
 # ROUTING FUNCTIONS: 조건부 흐름 제어
@@ -426,36 +478,38 @@ def route_after_greeting(state: VictimRecoveryState) -> Literal["emergency", "mo
         return "emergency"
     return "mode_detection"
 
-def route_after_mode_detection(state: VictimRecoveryState) -> Literal["assessment_question", "ai_decision", "greeting"]:
+# 모드별 다음 노드 (평가 질문과 하이브리드 판단은 서로 의존성이 없으므로 같은 super-step에서 병렬 실행)
+_MODE_ROUTES: Dict[str, Union[str, List[str]]] = {
+    "assessment": ["assessment_question", "decision_probe"],
+    "consultation": "ai_decision",
+}
+
+# 하이브리드 판단 결과별 상담 노드
+_DECISION_ROUTES: Dict[bool, str] = {
+    True: "ai_consultation",
+    False: "rule_consultation",
+}
+
+def route_after_mode_detection(state: VictimRecoveryState) -> Union[Literal["ai_decision", "greeting"], List[str]]:
     """모드 감지 후 라우팅"""
-    mode = state.get("conversation_mode", "unknown")
-    
-    if mode == "assessment":
-        return "assessment_question"
-    elif mode == "consultation":
-        return "ai_decision"
-    else:
-        return "greeting"  # 다시 인사로
+    # 미확정 모드는 다시 인사로
+    return _MODE_ROUTES.get(state.get("conversation_mode", "unknown"), "greeting")
 
 def route_after_assessment_question(state: VictimRecoveryState) -> Literal["assessment_answer", "ai_decision"]:
     """평가 질문 후 라우팅"""
-    if state.get("current_step") == "assessment_complete":
+    if state.get("assessment_step", 0) >= _CHECKLIST_LEN:
         return "ai_decision"  # 평가 완료 후 AI로 요약 요청
     return "assessment_answer"
 
 def route_after_assessment_answer(state: VictimRecoveryState) -> Literal["assessment_question", "ai_decision"]:
     """평가 답변 후 라우팅"""
-    question_result = assessment_question_generator_tool.invoke({"step": state.get("assessment_step", 0)})
-    
-    if question_result["is_complete"]:
+    if state.get("assessment_step", 0) >= _CHECKLIST_LEN:
         return "ai_decision"  # 평가 완료 -> AI 요약
     return "assessment_question"  # 다음 질문
 
 def route_after_ai_decision(state: VictimRecoveryState) -> Literal["ai_consultation", "rule_consultation"]:
     """AI 결정 후 라우팅"""
-    if state.get("use_ai_response", False):
-        return "ai_consultation"
-    return "rule_consultation"
+    return _DECISION_ROUTES[bool(state.get("use_ai_response", False))]
 
 def route_after_consultation(state: VictimRecoveryState) -> Literal["ai_decision", "conversation_complete"]:
     """상담 후 라우팅"""
@@ -475,11 +529,18 @@ class ProperLangGraphPhishingSystem:
     
     def __init__(self, debug: bool = True):
         self.debug = debug
-        self.graph = self._build_proper_langgraph()
+        self.session_id = None
+        self._current_state: Optional[VictimRecoveryState] = None
+        # 컴파일된 그래프는 인스턴스 간 공유 (세션 상태는 체크포인터의 thread_id별로 분리)
+        self.graph = _get_compiled_graph()
+        
+        # 압축 요약 캐시 (요약 대상 메시지 id 목록 -> 요약문)
+        self._summary_cache: "OrderedDict[tuple, str]" = OrderedDict()
         
         logger.info("✅ 진짜 LangGraph 아키텍처 시스템 초기화")
     
-    def _build_proper_langgraph(self) -> StateGraph:
+    @staticmethod
+    def _build_proper_langgraph() -> StateGraph:
         """진짜 LangGraph 구성"""
         
         # StateGraph 생성
@@ -487,10 +548,15 @@ class ProperLangGraphPhishingSystem:
         
         # 모든 노드 추가
         workflow.add_node("greeting", greeting_node)
-        workflow.add_node("mode_detection", mode_detection_node)
+        workflow.add_node(
+            "mode_detection",
+            mode_detection_node,
+            cache_policy=CachePolicy(key_func=_last_message_cache_key, ttl=600)
+        )
         workflow.add_node("emergency", emergency_detection_node)
         workflow.add_node("assessment_question", assessment_question_node)
         workflow.add_node("assessment_answer", assessment_answer_node)
+        workflow.add_node("decision_probe", decision_probe_node)
         workflow.add_node("ai_decision", ai_decision_node)
         workflow.add_node("ai_consultation", ai_consultation_node)
         workflow.add_node("rule_consultation", rule_consultation_node)
@@ -514,11 +580,15 @@ class ProperLangGraphPhishingSystem:
             route_after_mode_detection,
             {
                 "assessment_question": "assessment_question",
+                "decision_probe": "decision_probe",
                 "ai_decision": "ai_decision",
                 "greeting": "greeting"
             }
         )
         
+        # 선행 판단 결과는 decision_probe 리듀서로 병합되어 ai_decision에서 합류
+        workflow.add_edge("decision_probe", END)
+        
         workflow.add_conditional_edges(
             "assessment_question",
             route_after_assessment_question,
@@ -568,34 +638,87 @@ class ProperLangGraphPhishingSystem:
         workflow.add_edge("emergency", "conversation_complete")
         workflow.add_edge("conversation_complete", END)
         
-        return workflow.compile()
+        # 체크포인터가 세션(thread_id)별 상태를 보관 -> 매 턴 변경분만 전달
+        return workflow.compile(checkpointer=MemorySaver(), cache=InMemoryCache())
+    
+    async def _run_turn(self, user_input: str, session_id: str = None):
+        """한 턴 실행 - 그래프를 끝까지 실행하고 체크포인트 상태 반영"""
+        
+        # 이번 턴의 변경분만 전달 (이전 상태는 체크포인터가 보관)
+        turn_input = {"messages": [HumanMessage(content=user_input)]}
+        
+        # 세션 상태 생성 또는 조회
+        if not self._current_state:
+            self.session_id = session_id or f"session_{uuid.uuid4().hex[:12]}"
+            turn_input = {**create_initial_recovery_state(self.session_id), **turn_input}
+            turn_input["conversation_turns"] = 1
+        else:
+            turn_input["conversation_turns"] = self._current_state.get("conversation_turns", 0) + 1
+            turn_input["messages"] = await self._compact_if_needed(turn_input["messages"])
+        
+        if self.debug:
+            logger.info(f"🎯 LangGraph 처리: {user_input}")
+        
+        # LangGraph 실행 (응답 음성은 노드 안의 tts_delivery_tool이 처리)
+        self._current_state = await self.graph.ainvoke(
+            turn_input,
+            config={"configurable": {"thread_id": self.session_id}}
+        )
+    
+    async def _compact_if_needed(self, new_messages: List) -> List:
+        """메시지 기록이 임계치를 넘으면 오래된 메시지를 요약 1개로 압축한 변경분 반환"""
+        messages = self._current_state.get("messages", [])
+        if len(messages) <= _COMPACT_THRESHOLD:
+            return new_messages
+        
+        old_messages = messages[:-_COMPACT_KEEP_RECENT]
+        summary = await self._summarize_messages(old_messages)
+        
+        if self.debug:
+            logger.info(f"🗜️ 메시지 압축: {len(messages)}개 -> {_COMPACT_KEEP_RECENT + 1}개")
+        
+        # 전체 교체 후 [요약] + 최근 K개 + 새 입력 (요약은 고정 id라 재압축 시에도 1개만 유지)
+        return [
+            RemoveMessage(id=REMOVE_ALL_MESSAGES),
+            AIMessage(content=summary, id=_SUMMARY_MESSAGE_ID),
+            *messages[-_COMPACT_KEEP_RECENT:],
+            *new_messages
+        ]
+    
+    async def _summarize_messages(self, messages: List) -> str:
+        """오래된 메시지 요약 (1회성 LLM 호출, 같은 구간은 캐시 재사용)"""
+        cache_key = tuple(msg.id for msg in messages)
+        cached = self._summary_cache.get(cache_key)
+        if cached is not None:
+            self._summary_cache.move_to_end(cache_key)
+            return cached
+        
+        transcript = "\n".join(
+            f"{'사용자' if isinstance(msg, HumanMessage) else '상담원'}: {msg.content}"
+            for msg in messages
+        )
+        
+        from services.gemini_assistant import gemini_assistant
+        summary = await gemini_assistant.summarize_conversation(transcript)
+        
+        if not summary:
+            # 폴백: 사용자 발화만 잘라서 보관
+            user_lines = [msg.content for msg in messages if isinstance(msg, HumanMessage)]
+            summary = " / ".join(user_lines)[-300:]
+        
+        summary = f"[이전 대화 요약] {summary}"
+        self._summary_cache[cache_key] = summary
+        if len(self._summary_cache) > _SUMMARY_CACHE_SIZE:
+            self._summary_cache.popitem(last=False)
+        return summary
     
     async def process_user_input(self, user_input: str, session_id: str = None) -> str:
         """사용자 입력 처리 - 진짜 LangGraph 방식"""
         
         try:
-            # 세션 상태 생성 또는 조회
-            if not hasattr(self, '_current_state') or not self._current_state:
-                self._current_state = create_initial_recovery_state(
-                    session_id or f"session_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
-                )
+            await self._run_turn(user_input, session_id)
             
-            # 사용자 메시지 추가
-            self._current_state["messages"].append(HumanMessage(content=user_input))
-            self._current_state["conversation_turns"] = self._current_state.get("conversation_turns", 0) + 1
-            
-            if self.debug:
-                logger.info(f"🎯 LangGraph 처리: {user_input}")
-            
-            # LangGraph 실행 (진짜 그래프 사용!)
-            result_state = await self.graph.ainvoke(self._current_state)
-            
-            # 상태 업데이트
-            self._current_state = result_state
-            
-            # 마지막 AI 응답 추출
-            ai_messages = [msg for msg in result_state["messages"] if isinstance(msg, AIMessage)]
-            last_response = ai_messages[-1].content if ai_messages else "처리 중 오류가 발생했습니다."
+            last_response = self.get_last_response()
             
             if self.debug:
                 logger.info(f"✅ LangGraph 응답: {last_response}")
@@ -606,21 +729,37 @@ class ProperLangGraphPhishingSystem:
             logger.error(f"❌ LangGraph 처리 오류: {e}")
             return "일시적 문제가 발생했습니다. 132번으로 연락주세요."
     
-    def get_current_state(self) -> VictimRecoveryState:
+    def get_last_response(self) -> str:
+        """마지막 AI 응답 조회"""
+        # 응답 노드가 기록한 마지막 응답을 바로 조회 (메시지 전체 스캔 없음)
+        last_response = self._current_state.get("last_ai_response") if self._current_state else None
+        return last_response or "처리 중 오류가 발생했습니다."
+    
+    def get_current_state(self) -> Optional[VictimRecoveryState]:
         """현재 상태 조회"""
-        return getattr(self, '_current_state', None)
+        return self._current_state
     
     def reset_conversation(self):
         """대화 리셋"""
         self._current_state = None
+        self.session_id = None
         logger.info("🔄 대화 상태 리셋")
     
     async def cleanup(self):
         """정리"""
-        if hasattr(self, '_current_state'):
-            del self._current_state
+        self._current_state = None
+        self.session_id = None
         logger.info("🧹 LangGraph 시스템 정리 완료")
 
+_COMPILED_GRAPH = None
+
+def _get_compiled_graph():
+    """모듈 단위로 한 번만 컴파일한 그래프 반환"""
+    global _COMPILED_GRAPH
+    if _COMPILED_GRAPH is None:
+        _COMPILED_GRAPH = ProperLangGraphPhishingSystem._build_proper_langgraph()
+    return _COMPILED_GRAPH
+
 # ============================================================================
 # 기존 conversation_manager.py와의 통합
 # ============================================================================
@@ -635,14 +774,13 @@ class LangGraphConversationManager:
         # LangGraph 시스템 초기화
         self.ai_brain = ProperLangGraphPhishingSystem(debug=settings.DEBUG)
         
-        # 기존 컴포넌트들
-        from services.tts_service import tts_service
-        from services.audio_manager import audio_manager
-        self.tts_service = tts_service
-        self.audio_manager = audio_manager
+        # 기존 컴포넌트들 (오디오 스택 import는 initialize에서 지연 로딩)
+        self.tts_service = None
+        self.audio_manager = None
         
         # STT 설정
         self.stt_client = None
+        self.stt_task: Optional[asyncio.Task] = None
         
         # 상태 관리
         self.is_running = False
@@ -657,18 +795,24 @@ class LangGraphConversationManager:
     async def initialize(self) -> bool:
         """초기화 (기존 인터페이스 유지)"""
         try:
+            from services.tts_service import tts_service
+            from services.audio_manager import audio_manager
+            from services.stream_stt import RTZROpenAPIClient
+            self.tts_service = tts_service
+            self.audio_manager = audio_manager
+            
             # 1. 오디오 초기화
             if not self.audio_manager.initialize_output():
                 logger.error("❌ 오디오 초기화 실패")
                 return False
             
-            # 2. LangGraph AI 두뇌 테스트
-            test_response = await self.ai_brain.process_user_input("초기화 테스트")
-            if test_response:
-                logger.info("✅ LangGraph AI 두뇌 준비 완료")
+            # 2. LangGraph AI 두뇌 확인 (LLM 왕복 없이 컴파일 여부만 확인)
+            if self.ai_brain.graph is None:
+                logger.error("❌ LangGraph 그래프 컴파일 실패")
+                return False
+            logger.info("✅ LangGraph AI 두뇌 준비 완료")
             
             # 3. STT 클라이언트 생성
-            from services.stream_stt import RTZROpenAPIClient
             self.stt_client = RTZROpenAPIClient(self.client_id, self.client_secret)
             
             # 4. 초기 대화 시작 (LangGraph로!)
@@ -714,8 +858,8 @@ class LangGraphConversationManager:
         
         while self.is_running:
             try:
-                # STT 입력 확인
-                user_input = self._get_stt_input()
+                # STT 입력 대기 (폴링 없이 큐에서 직접 대기, 타임아웃마다 완료 여부 확인)
+                user_input = await self._get_stt_input()
                 
                 if user_input and not self.is_processing:
                     logger.info(f"👤 사용자 입력: {user_input}")
@@ -726,7 +870,6 @@ class LangGraphConversationManager:
                     logger.info("✅ LangGraph 대화 완료")
                     break
                 
-                await asyncio.sleep(0.1)
                 consecutive_errors = 0
                         
             except Exception as e:
@@ -785,39 +928,50 @@ class LangGraphConversationManager:
     
     def _start_stt_input_safe(self):
         """STT 입력 시작 (기존 방식 유지)"""
-        # 기존 STT 로직 그대로 사용
-        import threading
-        import queue
+        # STT 워커는 이벤트 루프에 결과를 넘기고, 메인 루프는 이벤트를 직접 await
+        # (단일 슬롯: 처리 중 새 발화가 오면 덮어써서 항상 최신 발화만 처리)
+        self._loop = asyncio.get_running_loop()
+        self.latest_utterance: Optional[str] = None
+        self.utterance_event = asyncio.Event()
         
-        self.stt_queue = queue.Queue(maxsize=5)
-        
-        def stt_worker():
-            try:
-                if self.stt_client:
-                    self.stt_client.reset_stream()
-                    
-                    def transcript_handler(start_time, transcript, is_final=False):
-                        if is_final and transcript.alternatives:
-                            text = transcript.alternatives[0].text.strip()
-                            if text and len(text) > 1:
-                                if not self.stt_queue.full():
-                                    self.stt_queue.put_nowait(text)
-                    
-                    self.stt_client.print_transcript = transcript_handler
-                    self.stt_client.transcribe_streaming_grpc()
-                    
-            except Exception as e:
-                logger.error(f"STT 워커 오류: {e}")
-        
-        self.stt_thread = threading.Thread(target=stt_worker, daemon=True)
-        self.stt_thread.start()
+        # 블로킹 gRPC 스트림은 asyncio.to_thread로 실행 (취소/예외 전파를 이벤트 루프가 관리)
+        self.stt_task = asyncio.create_task(asyncio.to_thread(self._stt_worker))
     
-    def _get_stt_input(self) -> str:
-        """STT 입력 가져오기"""
+    def _stt_worker(self):
+        """STT 워커 (워커 스레드에서 실행)"""
         try:
-            return self.stt_queue.get_nowait()
-        except:
+            if self.stt_client:
+                self.stt_client.reset_stream()
+                
+                def transcript_handler(start_time, transcript, is_final=False):
+                    if is_final and transcript.alternatives:
+                        text = transcript.alternatives[0].text.strip()
+                        if text and len(text) > 1:
+                            self._loop.call_soon_threadsafe(self._enqueue_stt_input, text)
+                
+                self.stt_client.print_transcript = transcript_handler
+                self.stt_client.transcribe_streaming_grpc()
+                
+        except Exception as e:
+            logger.error(f"STT 워커 오류: {e}")
+    
+    def _enqueue_stt_input(self, text: str):
+        """최신 STT 입력 기록 (이벤트 루프 스레드에서 실행, 이전 미처리 발화는 덮어씀)"""
+        if self.latest_utterance is not None:
+            logger.debug(f"미처리 발화 교체: {self.latest_utterance} -> {text}")
+        self.latest_utterance = text
+        self.utterance_event.set()
+    
+    async def _get_stt_input(self, timeout: float = 1.0) -> Optional[str]:
+        """STT 입력 가져오기 (입력이 올 때까지 대기, 타임아웃 시 None)"""
+        try:
+            await asyncio.wait_for(self.utterance_event.wait(), timeout=timeout)
+        except asyncio.TimeoutError:
             return None
+        
+        text, self.latest_utterance = self.latest_utterance, None
+        self.utterance_event.clear()
+        return text
     
     def set_callbacks(self, **callbacks):
         """콜백 설정 (기존 인터페이스 유지)"""
@@ -834,7 +988,7 @@ class LangGraphConversationManager:
         }
         
         # LangGraph 상태 추가
-        if hasattr(self.ai_brain, '_current_state') and self.ai_brain._current_state:
+        if self.ai_brain._current_state:
             langgraph_summary = self.ai_brain.get_conversation_summary(self.ai_brain._current_state)
             base_status.update(langgraph_summary)
         
@@ -858,9 +1012,16 @@ class LangGraphConversationManager:
             if hasattr(self.ai_brain, 'cleanup'):
                 await self.ai_brain.cleanup()
             
-            # 기존 컴포넌트 정리
-            if hasattr(self, 'stt_thread') and self.stt_thread.is_alive():
-                self.stt_thread.join(timeout=3)
+            # 기존 컴포넌트 정리 - 마이크 스트림을 닫아 워커가 반환되도록 한 뒤 태스크 취소
+            if self.stt_client and hasattr(self.stt_client, 'stream'):
+                try:
+                    self.stt_client.stream.terminate()
+                except Exception as e:
+                    logger.debug(f"STT 스트림 종료 오류 (무시됨): {e}")
+            
+            if self.stt_task:
+                self.stt_task.cancel()
+                await asyncio.gather(self.stt_task, return_exceptions=True)
             
             if self.audio_manager:
                 self.audio_manager.cleanup()
@@ -883,6 +1044,20 @@ OptimizedVoicePhishingGraph = ProperLangGraphPhishingSystem
 StructuredVoicePhishingGraph = ProperLangGraphPhishingSystem
 ConversationManager = LangGraphConversationManager
 
+async def run_batch(scripts: List[List[str]], debug: bool = False) -> List[List[str]]:
+    """독립된 대화 스크립트 여러 개를 세션별 시스템으로 동시에 실행 (회귀/부하 테스트용)"""
+    
+    async def run_script(index: int, script: List[str]) -> List[str]:
+        # 스크립트마다 별도 시스템 + 고유 세션 (공유 그래프의 체크포인트는 thread_id로 분리)
+        system = ProperLangGraphPhishingSystem(debug=debug)
+        session_id = f"batch_{index}_{uuid.uuid4().hex[:12]}"
+        try:
+            return [await system.process_user_input(user_input, session_id) for user_input in script]
+        finally:
+            await system.cleanup()
+    
+    return await asyncio.gather(*(run_script(i, script) for i, script in enumerate(scripts)))
+
 async def main():
     """LangGraph 시스템 테스트"""
     
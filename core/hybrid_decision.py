@@ -6,11 +6,142 @@
 """
 
 import logging
-from typing import List, Dict, Any, Protocol
+import re
+from collections import OrderedDict
+from types import MappingProxyType
+from typing import List, Dict, Any, Mapping, Protocol, Set, Sequence, Tuple
 from abc import ABC, abstractmethod
 
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+# ============================================================================
+# 감지기별 키워드 (모듈 로드 시 단일 스캐너로 컴파일 - 불변 tuple이라 스캐너와 어긋날 일 없음)
+# ============================================================================
+
+COMPLEXITY_INDICATORS = (
+    "자세히", "구체적으로", "설명", "어떻게", "왜", "뭐예요",
+    "어디예요", "누구예요", "언제예요", "무슨 뜻", "의미",
+    "방법", "조치", "무엇을", "어떡하죠", "궁금"  # <-- 핵심 키워드 추가
+)
+
+MISMATCH_INDICATORS = (
+    "말고", "아니라", "다른", "그런게 아니라", "추가로", "또"
+)
+
+DISSATISFACTION_INDICATORS = (
+    "이해 못하겠", "모르겠", "헷갈려", "어려워", "복잡해",
+    "제대로", "정확히", "확실히", "더 쉽게", "간단하게",
+    "상황을 묻지 말고", "자꾸 같은 말", "답변이 이상" # <-- 사용자 불만 직접 감지
+)
+
+EMERGENCY_KEYWORDS = (
+    "급해", "빨리", "즉시", "당장", "긴급", "위험", "큰일"
+)
+
+_DETECTOR_KEYWORDS = {
+    "complexity": COMPLEXITY_INDICATORS,
+    "context_mismatch": MISMATCH_INDICATORS,
+    "dissatisfaction": DISSATISFACTION_INDICATORS,
+    "emergency": EMERGENCY_KEYWORDS
+}
+
+_KEYWORD_OWNER = {
+    keyword: name
+    for name, keywords in _DETECTOR_KEYWORDS.items()
+    for keyword in keywords
+}
+
+# 모든 키워드를 하나의 alternation으로 컴파일 (긴 키워드 우선, lookahead로 겹치는 위치도 검사)
+_KEYWORD_PATTERN = re.compile(
+    "(?=(" + "|".join(re.escape(k) for k in sorted(_KEYWORD_OWNER, key=len, reverse=True)) + "))"
+)
+
+# pyahocorasick이 있으면 전체 키워드를 하나의 오토마톤으로 구성 (입력 1회 선형 스캔)
+_KEYWORD_AUTOMATON = None
+if AHOCORASICK_AVAILABLE:
+    _KEYWORD_AUTOMATON = ahocorasick.Automaton()
+    for _keyword, _owner in _KEYWORD_OWNER.items():
+        _KEYWORD_AUTOMATON.add_word(_keyword, _owner)
+    _KEYWORD_AUTOMATON.make_automaton()
+
+# 키워드 감지 시 감지기별 가중치 (응급 키워드는 -1.0으로 Gemini 차단)
+COMPLEXITY_WEIGHT = 0.4
+MISMATCH_WEIGHT = 0.6
+DISSATISFACTION_WEIGHT = 0.7
+EMERGENCY_BLOCK_SCORE = -1.0
+
+# 판단 결과 LRU 캐시 크기 (반복되는 음성 입력은 감지기 평가 생략)
+_DECISION_CACHE_SIZE = 256
+
+# 짧은 입력에 대한 고정 판단 결과 (읽기 전용 - 반환 시 _copy_decision으로 복사)
+_SHORT_INPUT_DECISION = MappingProxyType({
+    "use_gemini": False,
+    "confidence": 0.0,
+    "reasons": ("입력이 너무 짧음",),
+    "detector_scores": MappingProxyType({})
+})
+
+def _copy_decision(decision: Mapping[str, Any]) -> Dict[str, Any]:
+    """판단 결과 복사 (reasons/detector_scores까지 - 캐시/공유 객체를 호출자가 수정해도 안전)"""
+    return {
+        **decision,
+        "reasons": list(decision["reasons"]),
+        "detector_scores": dict(decision["detector_scores"])
+    }
+
+def _scan_lowered(user_lower: str) -> Set[str]:
+    """소문자화된 입력을 한 번만 훑어 키워드가 감지된 감지기 이름 집합 반환"""
+    if _KEYWORD_AUTOMATON is not None:
+        return {owner for _, owner in _KEYWORD_AUTOMATON.iter(user_lower)}
+    return {_KEYWORD_OWNER[m.group(1)] for m in _KEYWORD_PATTERN.finditer(user_lower)}
+
+def _keyword_matched(name: str, indicators: Sequence[str], user_input: str, context: Dict[str, Any]) -> bool:
+    """공유 스캔 결과가 있으면 재사용, 없으면 단독으로 키워드 검사"""
+    hits = context.get("_keyword_hits")
+    if hits is not None:
+        return name in hits
+    
+    user_lower = context.get("_user_lower") or user_input.lower()
+    return any(indicator in user_lower for indicator in indicators)
+
+def _looks_like_question(user_input: str) -> bool:
+    """문장 길이/어미로 본 질문 가능성 (15자 이상이면 질문일 가능성 높음)"""
+    return len(user_input) > 15 and "?" in user_input or "요" in user_input
+
+def _repeats_last_answer(user_lower: str, context: Dict[str, Any]) -> bool:
+    """AI가 이전에 했던 말을 사용자가 다시 질문하는 경우 (예: "112번이요" 했는데 다시 "112번이 뭐죠?")"""
+    last_ai_response = context.get("last_ai_response", "")
+    if not last_ai_response:
+        return False
+    if "132" in last_ai_response and "132" in user_lower and len(user_lower) > 5:
+        return True
+    return "1811" in last_ai_response and "1811" in user_lower and len(user_lower) > 10
+
+def _score_builtin_detectors(user_input: str, user_lower: str, hits: Set[str],
+                             context: Dict[str, Any]) -> Dict[str, float]:
+    """기본 감지기 4종의 점수를 한 번의 스캔 결과로 계산 (감지기별 evaluate 호출 생략)"""
+    complexity = COMPLEXITY_WEIGHT if "complexity" in hits else 0.0
+    if _looks_like_question(user_input):
+        complexity += 0.2
+    
+    mismatch = MISMATCH_WEIGHT if "context_mismatch" in hits else 0.0
+    if _repeats_last_answer(user_lower, context):
+        mismatch += 0.5
+    
+    # 엔진의 감지기 평가 순서와 동일하게 (차단 조건 먼저)
+    return {
+        "emergency": EMERGENCY_BLOCK_SCORE if "emergency" in hits else 0.0,
+        "complexity": min(complexity, 1.0),
+        "dissatisfaction": DISSATISFACTION_WEIGHT if "dissatisfaction" in hits else 0.0,
+        "context_mismatch": min(mismatch, 1.0)
+    }
+
 # ============================================================================
 # 인터페이스 정의 (SOLID - 인터페이스 분리 원칙)
 # ============================================================================
@@ -40,29 +171,22 @@ class IDecisionEngine(Protocol):
 class ComplexityDetector:
     """복잡성 감지기 (개선 버전)"""
     
-    def __init__(self):
-        self.complexity_indicators = [
-            "자세히", "구체적으로", "설명", "어떻게", "왜", "뭐예요",
-            "어디예요", "누구예요", "언제예요", "무슨 뜻", "의미",
-            "방법", "조치", "무엇을", "어떡하죠", "궁금"  # <-- 핵심 키워드 추가
-        ]
+    __slots__ = ()  # 인스턴스 상태 없음 (키워드는 모듈 상수를 클래스에서 공유)
+    complexity_indicators = COMPLEXITY_INDICATORS
     
     def evaluate(self, user_input: str, context: Dict[str, Any]) -> float:
         """복잡성 평가"""
         if not user_input:
             return 0.0
         
-        user_lower = user_input.lower()
         score = 0.0
         
-        # 질문 키워드 체크
-        for indicator in self.complexity_indicators:
-            if indicator in user_lower:
-                score += 0.4  # 점수 상향
-                break # 하나만 찾아도 충분히 복잡한 질문으로 간주
+        # 질문 키워드 체크 (하나만 찾아도 충분히 복잡한 질문으로 간주)
+        if _keyword_matched("complexity", self.complexity_indicators, user_input, context):
+            score += COMPLEXITY_WEIGHT  # 점수 상향
         
-        # 문장 길이 체크 (15자 이상이면 질문일 가능성 높음)
-        if len(user_input) > 15 and "?" in user_input or "요" in user_input:
+        # 문장 길이 체크
+        if _looks_like_question(user_input):
             score += 0.2
         
         return min(score, 1.0)
@@ -73,32 +197,24 @@ class ComplexityDetector:
 class ContextMismatchDetector:
     """문맥 불일치 감지기 (개선 버전)"""
     
-    def __init__(self):
-        self.mismatch_indicators = [
-            "말고", "아니라", "다른", "그런게 아니라", "추가로", "또"
-        ]
+    __slots__ = ()
+    mismatch_indicators = MISMATCH_INDICATORS
     
     def evaluate(self, user_input: str, context: Dict[str, Any]) -> float:
         """문맥 불일치 평가"""
         if not user_input:
             return 0.0
         
-        user_lower = user_input.lower()
+        user_lower = context.get("_user_lower") or user_input.lower()
         score = 0.0
         
         # 명시적 반박 표현
-        for indicator in self.mismatch_indicators:
-            if indicator in user_lower:
-                score += 0.6 # 점수 대폭 상향
-                break
-
-        # AI가 이전에 했던 말을 사용자가 다시 질문하는 경우 (예: "112번이요" 했는데 다시 "112번이 뭐죠?")
-        last_ai_response = context.get("last_ai_response", "")
-        if last_ai_response:
-            if "132" in last_ai_response and "132" in user_lower and len(user_lower) > 5:
-                score += 0.5
-            elif "1811" in last_ai_response and "1811" in user_lower and len(user_lower) > 10:
-                score += 0.5
+        if _keyword_matched("context_mismatch", self.mismatch_indicators, user_input, context):
+            score += MISMATCH_WEIGHT # 점수 대폭 상향
+
+        # 이전 답변에 대한 재질문
+        if _repeats_last_answer(user_lower, context):
+            score += 0.5
 
         return min(score, 1.0)
     
@@ -108,26 +224,19 @@ class ContextMismatchDetector:
 class DissatisfactionDetector:
     """불만족 감지기 (개선 버전)"""
     
-    def __init__(self):
-        self.dissatisfaction_indicators = [
-            "이해 못하겠", "모르겠", "헷갈려", "어려워", "복잡해",
-            "제대로", "정확히", "확실히", "더 쉽게", "간단하게",
-            "상황을 묻지 말고", "자꾸 같은 말", "답변이 이상" # <-- 사용자 불만 직접 감지
-        ]
+    __slots__ = ()
+    dissatisfaction_indicators = DISSATISFACTION_INDICATORS
     
     def evaluate(self, user_input: str, context: Dict[str, Any]) -> float:
         """불만족 평가"""
         if not user_input:
             return 0.0
         
-        user_lower = user_input.lower()
         score = 0.0
         
         # 불만족 표현 체크
-        for indicator in self.dissatisfaction_indicators:
-            if indicator in user_lower:
-                score += 0.7  # 점수 대폭 상향
-                break
+        if _keyword_matched("dissatisfaction", self.dissatisfaction_indicators, user_input, context):
+            score += DISSATISFACTION_WEIGHT  # 점수 대폭 상향
         
         return min(score, 1.0)
     
@@ -137,22 +246,17 @@ class DissatisfactionDetector:
 class EmergencyDetector:
     """응급 상황 감지기"""
     
-    def __init__(self):
-        self.emergency_keywords = [
-            "급해", "빨리", "즉시", "당장", "긴급", "위험", "큰일"
-        ]
+    __slots__ = ()
+    emergency_keywords = EMERGENCY_KEYWORDS
     
     def evaluate(self, user_input: str, context: Dict[str, Any]) -> float:
         """응급 상황 평가 (응급상황은 Gemini 사용 안함)"""
         if not user_input:
             return 0.0
         
-        user_lower = user_input.lower()
-        
         # 응급 키워드가 있으면 Gemini 사용하지 않음 (빠른 처리 우선)
-        for keyword in self.emergency_keywords:
-            if keyword in user_lower:
-                return -1.0  # 음수로 Gemini 사용 방지
+        if _keyword_matched("emergency", self.emergency_keywords, user_input, context):
+            return EMERGENCY_BLOCK_SCORE  # 음수로 Gemini 사용 방지
         
         return 0.0
     
@@ -171,16 +275,20 @@ class SimplifiedHybridDecisionEngine:
     - 확장 가능한 구조
     """
     
+    __slots__ = ("debug", "detectors", "_builtin_detectors_only", "thresholds", "stats", "_decision_cache")
+    
     def __init__(self, debug: bool = True):
         self.debug = debug
         
         # 판단 기준들 (의존성 주입 가능)
+        # 평가 순서: 차단 조건(응급) 먼저, 이후 키워드가 적은 순 - 임계값 도달 시 나머지 생략
         self.detectors = {
+            "emergency": EmergencyDetector(),
             "complexity": ComplexityDetector(),
-            "context_mismatch": ContextMismatchDetector(),
             "dissatisfaction": DissatisfactionDetector(),
-            "emergency": EmergencyDetector()
+            "context_mismatch": ContextMismatchDetector()
         }
+        self._builtin_detectors_only = True
         
         # 임계값 설정 (음성 친화적으로 보수적)
         self.thresholds = {
@@ -196,6 +304,9 @@ class SimplifiedHybridDecisionEngine:
             "emergency_blocks": 0
         }
         
+        # (입력, 직전 AI 응답) -> (판단 결과, 통계 키)
+        self._decision_cache: "OrderedDict[tuple, Tuple[Dict[str, Any], str]]" = OrderedDict()
+        
         if self.debug:
             print("✅ 간소화된 하이브리드 의사결정 엔진 초기화")
     
@@ -214,9 +325,38 @@ class SimplifiedHybridDecisionEngine:
         
         self.stats["total_decisions"] += 1
         
+        # 1. 기본 입력 검증 (결과 dict 생성 전에 바로 반환)
+        if not user_input or len(user_input.strip()) < 3:
+            self.stats["rule_decisions"] += 1
+            return _copy_decision(_SHORT_INPUT_DECISION)
+        
         if not context:
             context = {}
         
+        # 기본 감지기는 입력과 직전 AI 응답에만 의존하므로 결과 재사용
+        cache_key = None
+        if self._builtin_detectors_only:
+            cache_key = (user_input, context.get("last_ai_response", ""))
+            cached = self._decision_cache.get(cache_key)
+            if cached is not None:
+                self._decision_cache.move_to_end(cache_key)
+                decision, stat_key = cached
+                self.stats[stat_key] += 1
+                logger.debug("♻️ 캐시된 판단 재사용: %s", stat_key)
+                return _copy_decision(decision)
+        
+        decision, stat_key = self._decide(user_input, context)
+        self.stats[stat_key] += 1
+        
+        if cache_key is not None:
+            self._decision_cache[cache_key] = (_copy_decision(decision), stat_key)
+            if len(self._decision_cache) > _DECISION_CACHE_SIZE:
+                self._decision_cache.popitem(last=False)
+        
+        return decision
+    
+    def _decide(self, user_input: str, context: Dict[str, Any]) -> Tuple[Dict[str, Any], str]:
+        """감지기 평가 및 최종 판단 (판단 결과와 올릴 통계 키 반환)"""
         decision = {
             "use_gemini": False,
             "confidence": 0.0,
@@ -224,53 +364,103 @@ class SimplifiedHybridDecisionEngine:
             "detector_scores": {}
         }
         
-        # 1. 기본 입력 검증
-        if not user_input or len(user_input.strip()) < 3:
-            decision["reasons"].append("입력이 너무 짧음")
-            self.stats["rule_decisions"] += 1
-            return decision
-        
-        # 2. 각 감지기로 평가
+        # 2. 각 감지기로 평가 (키워드는 한 번의 스캔으로 모든 감지기에 공유)
         total_score = 0.0
-        active_detectors = []
+        active_reasons = []  # 의미있는 점수를 낸 감지기의 판단 이유
+        user_lower = user_input.lower()  # 소문자 변환은 여기서 한 번만
+        keyword_hits = _scan_lowered(user_lower)
+        
+        if self._builtin_detectors_only:
+            # 기본 감지기만 있으면 스캔 결과로 바로 점수 계산
+            scored = _score_builtin_detectors(user_input, user_lower, keyword_hits, context).items()
+        else:
+            # 외부 감지기가 등록된 경우 감지기별 evaluate 호출 (차단 조건/임계값 도달 시 즉시 중단)
+            scan_context = {
+                **context,
+                "_user_lower": user_lower,
+                "_keyword_hits": keyword_hits
+            }
+            scored = (
+                (name, detector.evaluate(user_input, scan_context))
+                for name, detector in self.detectors.items()
+            )
         
-        for name, detector in self.detectors.items():
-            score = detector.evaluate(user_input, context)
+        # 조기 종료는 기본 감지기만 있을 때만 (차단 감지기인 응급이 맨 앞이라 안전)
+        # 추가 감지기는 기본 감지기 뒤에 있으므로 차단 조건을 놓치지 않도록 모두 평가
+        early_exit = self._builtin_detectors_only
+        use_threshold = self.thresholds["gemini_use_threshold"]
+        
+        for name, score in scored:
+            detector = self.detectors[name]
             decision["detector_scores"][name] = score
             
             if score > 0.3:  # 의미있는 점수만 고려
                 total_score += score
-                active_detectors.append((name, detector, score))
+                active_reasons.append(detector.get_reason())
+                
+                # 점수는 더해지기만 하므로 임계값을 넘으면 결정 확정 (남은 감지기 생략)
+                if early_exit and total_score >= use_threshold:
+                    break
                 
             elif score < 0:  # 응급상황 등 차단 조건
                 decision["reasons"].append(detector.get_reason())
-                self.stats["emergency_blocks"] += 1
-                return decision
+                return decision, "emergency_blocks"
         
         # 3. 최종 판단
         decision["confidence"] = min(total_score, 1.0)
         
         if decision["confidence"] >= self.thresholds["gemini_use_threshold"]:
             decision["use_gemini"] = True
-            decision["reasons"] = [detector.get_reason() for _, detector, _ in active_detectors]
-            self.stats["gemini_decisions"] += 1
+            decision["reasons"] = active_reasons
+            stat_key = "gemini_decisions"
             
-            if self.debug:
-                print(f"🤖 Gemini 사용 결정: {decision['confidence']:.2f}")
-                print(f"   이유: {', '.join(decision['reasons'])}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("🤖 Gemini 사용 결정: %.2f (이유: %s)", decision["confidence"], ", ".join(decision["reasons"]))
         else:
             decision["use_gemini"] = False
             decision["reasons"] = ["룰 기반으로 충분히 처리 가능"]
-            self.stats["rule_decisions"] += 1
+            stat_key = "rule_decisions"
             
-            if self.debug:
-                print(f"⚡ 룰 기반 사용: {decision['confidence']:.2f}")
+            logger.debug("⚡ 룰 기반 사용: %.2f", decision["confidence"])
         
-        return decision
+        return decision, stat_key
+    
+    def score_batch(self, inputs: List[str], context: Dict[str, Any] = None) -> List[float]:
+        """
+        여러 입력의 Gemini 사용 신뢰도 일괄 계산 (로그 재생/임계값 튜닝용, 통계/디버그 출력 없음)
+        
+        조기 종료 없이 모든 감지기 점수를 합산하므로 임계값을 바꿔가며 재사용 가능
+        (use_gemini = 신뢰도 >= 임계값). 짧은 입력은 0.0, 응급 차단은 EMERGENCY_BLOCK_SCORE.
+        """
+        context = context or {}
+        confidences = []
+        
+        for user_input in inputs:
+            if not user_input or len(user_input.strip()) < 3:
+                confidences.append(0.0)
+                continue
+            
+            user_lower = user_input.lower()
+            keyword_hits = _scan_lowered(user_lower)
+            
+            if self._builtin_detectors_only:
+                scores = _score_builtin_detectors(user_input, user_lower, keyword_hits, context).values()
+            else:
+                scan_context = {**context, "_user_lower": user_lower, "_keyword_hits": keyword_hits}
+                scores = [detector.evaluate(user_input, scan_context) for detector in self.detectors.values()]
+            
+            if any(score < 0 for score in scores):
+                confidences.append(EMERGENCY_BLOCK_SCORE)
+            else:
+                confidences.append(min(sum(score for score in scores if score > 0.3), 1.0))
+        
+        return confidences
     
     def add_detector(self, name: str, detector) -> None:
-        """새로운 감지기 추가 (개방-폐쇄 원칙)"""
+        """새로운 감지기 추가 (개방-폐쇄 원칙) - 추가 감지기는 기본 감지기 뒤에 평가됨"""
         self.detectors[name] = detector
+        self._builtin_detectors_only = False
+        self._decision_cache.clear()
         if self.debug:
             print(f"✅ 새로운 감지기 추가: {name}")
     
@@ -278,6 +468,7 @@ class SimplifiedHybridDecisionEngine:
         """임계값 업데이트"""
         if threshold_name in self.thresholds:
             self.thresholds[threshold_name] = value
+            self._decision_cache.clear()
             if self.debug:
                 print(f"🔧 임계값 업데이트: {threshold_name} = {value}")
     
@@ -305,6 +496,17 @@ class SimplifiedHybridDecisionEngine:
         if self.debug:
             print("📊 통계 초기화 완료")
 
+_GLOBAL_ENGINE = None
+
+def get_engine(debug: bool = False) -> SimplifiedHybridDecisionEngine:
+    """프로세스 공용 엔진 반환 (감지기/임계값/판단 캐시를 호출 간 공유, 통계는 프로세스 전체 누적)"""
+    global _GLOBAL_ENGINE
+    if _GLOBAL_ENGINE is None:
+        _GLOBAL_ENGINE = SimplifiedHybridDecisionEngine(debug=debug)
+    elif _GLOBAL_ENGINE.debug != debug:
+        logger.warning(f"⚠️ 공용 엔진이 이미 debug={_GLOBAL_ENGINE.debug}로 생성됨 - 요청한 debug={debug}는 무시됩니다")
+    return _GLOBAL_ENGINE
+
 # ============================================================================
 # 테스트 및 검증
 # ============================================================================
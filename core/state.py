@@ -1,7 +1,9 @@
 from typing import TypedDict, List, Optional, Dict, Any, Annotated
 from datetime import datetime
 from enum import Enum
-import operator
+
+from langchain_core.messages import AnyMessage
+from langgraph.graph.message import add_messages
 
 class DamageType(Enum):
     """피해 유형 - 환급 절차별 분류"""
@@ -23,6 +25,10 @@ class RecoveryStage(Enum):
     REFUND_PROCESS = "refund_process"        # 환급 처리
     FOLLOW_UP = "follow_up"                  # 사후 관리
 
+def merge_dicts(left: Optional[Dict[str, Any]], right: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    """병렬 노드가 같은 super-step에서 기록한 dict 결과 병합 (리듀서)"""
+    return {**(left or {}), **(right or {})}
+
 class VictimRecoveryState(TypedDict):
     """피해자 상태 - 실제 환급 절차 중심"""
     
@@ -31,8 +37,8 @@ class VictimRecoveryState(TypedDict):
     current_stage: str
     recovery_stage: str
     
-    # LangGraph 표준 - 메시지 누적
-    messages: Annotated[List[Dict[str, Any]], operator.add]
+    # LangGraph 표준 - 메시지 누적 (add_messages: 변경분만 병합, id 기준 중복 제거)
+    messages: Annotated[List[AnyMessage], add_messages]
     
     # 피해 정보
     damage_type: Optional[str]
@@ -77,10 +83,23 @@ class VictimRecoveryState(TypedDict):
     
     # 긴급도
     urgency_level: int             # 1-10
+    is_emergency: bool             # 응급 경로로 처리되었는지
     
     # 추가 피해 방지
     additional_security_needed: bool
     security_measures_taken: List[str]
+    
+    # 그래프 흐름 제어 (노드가 변경분으로 기록)
+    current_step: str
+    conversation_mode: str
+    assessment_step: int
+    assessment_responses: Dict[str, Any]
+    use_ai_response: bool
+    decision_confidence: float
+    last_ai_response: str           # 마지막 AI 응답 (응답 노드가 덮어씀)
+    
+    # 병렬 의사결정 결과 (decision_probe 노드가 평가 질문과 동시에 기록)
+    decision_probe: Annotated[Dict[str, Any], merge_dicts]
 
 def create_initial_recovery_state(session_id: str) -> VictimRecoveryState:
     """초기 피해자 상태 생성"""
@@ -144,8 +163,21 @@ def create_initial_recovery_state(session_id: str) -> VictimRecoveryState:
         
         # 긴급도
         urgency_level=5, # 기본값 5로 설정
+        is_emergency=False,
         
         # 보안
         additional_security_needed=False,
-        security_measures_taken=[]
+        security_measures_taken=[],
+        
+        # 그래프 흐름 제어
+        current_step="greeting_complete",
+        conversation_mode="unknown",
+        assessment_step=0,
+        assessment_responses={},
+        use_ai_response=False,
+        decision_confidence=0.0,
+        last_ai_response="",
+        
+        # 병렬 의사결정
+        decision_probe={}
     )
\ No newline at end of file
@@ -4,23 +4,40 @@
 """
 
 import asyncio
+import functools
+import importlib.util
 import logging
+import logging.handlers
+import os
+import queue
 import signal
 import sys
 import psutil
 import gc
 import threading
+import time
 from pathlib import Path
 from datetime import datetime
 
+try:
+    import uvloop
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    UVLOOP_AVAILABLE = False
+
 # 프로젝트 루트를 패스에 추가
 sys.path.insert(0, str(Path(__file__).parent))
 
 from config.settings import settings
 
+# 로그 큐 리스너 (실제 출력은 백그라운드 스레드에서 수행)
+_LOG_LISTENER = None
+_LOG_QUEUE_HANDLER = None
+
 # 음성 친화적 로깅 설정
 def setup_voice_friendly_logging():
-    """간단하고 빠른 로깅 설정"""
+    """간단하고 빠른 로깅 설정 - 큐 핸들러로 출력 I/O를 이벤트 루프에서 분리"""
+    global _LOG_LISTENER, _LOG_QUEUE_HANDLER
     
     log_level = getattr(logging, settings.LOG_LEVEL, logging.INFO)
     
@@ -34,6 +51,13 @@ def setup_voice_friendly_logging():
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setFormatter(formatter)
     console_handler.setLevel(log_level)
+    console_handler.addFilter(lambda record: record.name != "console")
+    
+    # 대화 표시 핸들러 (사용자/상담원 발화 - 포맷 없이 메시지만, 로그 레벨과 무관하게 출력)
+    message_handler = logging.StreamHandler(sys.stdout)
+    message_handler.setFormatter(logging.Formatter('%(message)s'))
+    message_handler.addFilter(logging.Filter("console"))
+    logging.getLogger("console").setLevel(logging.INFO)
     
     # 루트 로거 설정
     root_logger = logging.getLogger()
@@ -43,7 +67,16 @@ def setup_voice_friendly_logging():
     for handler in root_logger.handlers[:]:
         root_logger.removeHandler(handler)
     
-    root_logger.addHandler(console_handler)
+    # 호출 측(QueueHandler.prepare)은 메시지 % 치환만 하고 큐에 넣음
+    # 핸들러 포맷(시간/레벨 등)과 stdout 쓰기는 리스너 스레드가 담당
+    log_queue = queue.SimpleQueue()
+    _LOG_QUEUE_HANDLER = logging.handlers.QueueHandler(log_queue)
+    root_logger.addHandler(_LOG_QUEUE_HANDLER)
+    
+    _LOG_LISTENER = logging.handlers.QueueListener(
+        log_queue, console_handler, message_handler, respect_handler_level=True
+    )
+    _LOG_LISTENER.start()
     
     # 외부 라이브러리 로그 최소화
     logging.getLogger('elevenlabs').setLevel(logging.ERROR)
@@ -51,8 +84,79 @@ def setup_voice_friendly_logging():
     logging.getLogger('pyaudio').setLevel(logging.ERROR)
     logging.getLogger('google').setLevel(logging.ERROR)
 
+def shutdown_logging():
+    """큐 리스너 정지 (남은 로그 모두 출력) 후 이후 로그는 직접 출력하도록 복구"""
+    global _LOG_LISTENER
+    
+    if _LOG_LISTENER is None:
+        return
+    
+    _LOG_LISTENER.stop()
+    
+    root_logger = logging.getLogger()
+    root_logger.removeHandler(_LOG_QUEUE_HANDLER)
+    for handler in _LOG_LISTENER.handlers:
+        root_logger.addHandler(handler)
+    
+    _LOG_LISTENER = None
+
 setup_voice_friendly_logging()
 logger = logging.getLogger(__name__)
+console = logging.getLogger("console")  # 대화 표시용 (큐 경유 출력)
+
+_STDIN_FD = 0  # 디버그 콘솔 입력 (stdin)
+
+# 상태 변경 표시 아이콘 (콜백마다 dict를 새로 만들지 않도록 모듈 상수로 유지)
+_STATE_ICONS = {
+    "idle": "💤",
+    "listening": "👂", 
+    "processing": "🧠",
+    "speaking": "🗣️",
+    "error": "❌"
+}
+_state_icon = _STATE_ICONS.get
+
+# 대화 통계 출력 (조회 키/기본값, 순서는 포맷 문자열과 동일)
+_CONVERSATION_STATUS_KEYS = (
+    ("state", "unknown"),
+    ("is_running", False),
+    ("is_processing", False),
+    ("total_turns", 0),
+    ("avg_response_time", 0),
+    ("error_count", 0)
+)
+_CONVERSATION_STATS_FORMAT = (
+    "\n📊 대화 통계:\n"
+    "   상태: {}\n"
+    "   실행 중: {}\n"
+    "   처리 중: {}\n"
+    "   총 턴: {}\n"
+    "   평균 응답시간: {:.3f}초\n"
+    "   오류 수: {}\n"
+)
+
+# 진단 대상 라이브러리 (표시 이름, import 이름)
+_DIAGNOSTIC_LIBRARIES = (
+    ('pyaudio', 'pyaudio'),
+    ('grpc', 'grpc'),
+    ('elevenlabs', 'elevenlabs'),
+    ('google.generativeai', 'google.generativeai'),
+    ('pydub', 'pydub')
+)
+
+@functools.lru_cache(maxsize=1)
+def _diagnostic_api_key_rows() -> tuple:
+    """진단용 API 키 행 (이름, 설정 여부, 마스킹 값) - 설정은 로드 후 불변이므로 한 번만 계산"""
+    api_keys = (
+        ('ReturnZero ID', settings.RETURNZERO_CLIENT_ID),
+        ('ReturnZero Secret', settings.RETURNZERO_CLIENT_SECRET),
+        ('ElevenLabs', settings.ELEVENLABS_API_KEY),
+        ('Gemini', settings.GEMINI_API_KEY)
+    )
+    return tuple(
+        (name, bool(key), f"{key[:8]}..." if key and len(key) > 8 else "없음")
+        for name, key in api_keys
+    )
 
 class VoiceFriendlyPhishingApp:
     """음성 친화적 보이스피싱 상담 애플리케이션 - 디버깅 강화"""
@@ -61,10 +165,18 @@ class VoiceFriendlyPhishingApp:
         self.conversation_manager = None
         self.is_running = False
         self.start_time = None
+        self._start_monotonic = 0.0  # 경과 시간 측정용 (벽시계 변경 영향 없음)
+        self._loop = None
+        self._stdin_buffer = b""
+        self._stdin_reader_active = False
+        self._main_task = None
+        self._debug = bool(settings.DEBUG)  # 콜백/실행 경로에서 settings 조회 대신 사용
         
         # 시스템 모니터링
         self.process = psutil.Process()
         self.initial_memory = self.process.memory_info().rss
+        self.process.cpu_percent(None)  # 기준점 설정 - 이후 호출은 블로킹 없이 구간 사용률 반환
+        self._process_info_cache = None  # (rss, cpu, 샘플 시각)
         
         # 통계
         self.stats = {
@@ -77,85 +189,71 @@ class VoiceFriendlyPhishingApp:
     async def run_diagnostics(self):
         """시스템 진단 실행"""
         
-        print("🔍 === 시스템 진단 시작 ===")
-        print()
+        # 출력은 줄 단위 print 대신 모아서 한 번에 기록 (섹션 단위 flush)
+        lines = ["🔍 === 시스템 진단 시작 ===", ""]
         
         # 1. 환경 설정 확인
-        print("📋 환경 설정 확인:")
-        print(f"   DEBUG 모드: {'✅' if settings.DEBUG else '❌'}")
-        print(f"   LOG_LEVEL: {settings.LOG_LEVEL}")
-        print()
+        lines.append("📋 환경 설정 확인:")
+        lines.append(f"   DEBUG 모드: {'✅' if settings.DEBUG else '❌'}")
+        lines.append(f"   LOG_LEVEL: {settings.LOG_LEVEL}")
+        lines.append("")
         
         # 2. API 키 확인
-        print("🔑 API 키 확인:")
-        api_keys = {
-            'ReturnZero ID': settings.RETURNZERO_CLIENT_ID,
-            'ReturnZero Secret': settings.RETURNZERO_CLIENT_SECRET,
-            'ElevenLabs': settings.ELEVENLABS_API_KEY,
-            'Gemini': settings.GEMINI_API_KEY
-        }
-        
-        for name, key in api_keys.items():
-            status = "✅" if key else "❌"
-            masked_key = f"{key[:8]}..." if key and len(key) > 8 else "없음"
-            print(f"   {name}: {status} ({masked_key})")
-        print()
+        lines.append("🔑 API 키 확인:")
+        for name, present, masked_key in _diagnostic_api_key_rows():
+            lines.append(f"   {name}: {'✅' if present else '❌'} ({masked_key})")
+        lines.append("")
         
         # 3. 라이브러리 가용성 확인
-        print("📚 라이브러리 확인:")
-        libraries = [
-            ('pyaudio', 'pyaudio'),
-            ('grpc', 'grpc'),
-            ('elevenlabs', 'elevenlabs'),
-            ('google.generativeai', 'google.generativeai'),
-            ('pydub', 'pydub')
-        ]
-        
-        for lib_name, import_name in libraries:
+        lines.append("📚 라이브러리 확인:")
+        
+        # 실제 import 없이 설치 여부만 확인 (grpc, genai 등 무거운 모듈 초기화 생략)
+        for lib_name, import_name in _DIAGNOSTIC_LIBRARIES:
             try:
-                __import__(import_name)
-                print(f"   {lib_name}: ✅")
-            except ImportError as e:
-                print(f"   {lib_name}: ❌ ({e})")
-        print()
+                found = importlib.util.find_spec(import_name) is not None
+            except ImportError:  # 상위 패키지 자체가 없는 경우
+                found = False
+            lines.append(f"   {lib_name}: {'✅' if found else '❌ (설치되지 않음)'}")
+        lines.append("")
+        
+        self._emit_lines(lines)
         
         # 4. 컴포넌트별 테스트
         await self._test_components()
         
-        print("🔍 === 시스템 진단 완료 ===")
-        print()
+        self._emit_lines(["🔍 === 시스템 진단 완료 ===", ""])
 
     async def _test_components(self):
         """컴포넌트별 개별 테스트"""
         
-        print("🧪 컴포넌트 테스트:")
+        lines = ["🧪 컴포넌트 테스트:"]
         
         # TTS 서비스 테스트
         try:
             from services.tts_service import tts_service
-            print("   TTS 서비스 로드: ✅")
+            lines.append("   TTS 서비스 로드: ✅")
             
             if tts_service.is_enabled:
-                print("   TTS 활성화: ✅")
+                lines.append("   TTS 활성화: ✅")
                 # 연결 테스트
                 test_result = await asyncio.wait_for(
                     tts_service.test_connection(), 
                     timeout=10.0
                 )
-                print(f"   TTS 연결 테스트: {'✅' if test_result else '❌'}")
+                lines.append(f"   TTS 연결 테스트: {'✅' if test_result else '❌'}")
             else:
-                print("   TTS 활성화: ❌ (API 키 없음)")
+                lines.append("   TTS 활성화: ❌ (API 키 없음)")
                 
         except Exception as e:
-            print(f"   TTS 서비스: ❌ ({e})")
+            lines.append(f"   TTS 서비스: ❌ ({e})")
         
         # AI 두뇌 테스트
         try:
             from core.graph import VoiceFriendlyPhishingGraph
-            print("   AI 그래프 로드: ✅")
+            lines.append("   AI 그래프 로드: ✅")
             
             ai_brain = VoiceFriendlyPhishingGraph(debug=True)
-            print("   AI 두뇌 생성: ✅")
+            lines.append("   AI 두뇌 생성: ✅")
             
             # 간단한 테스트
             test_response = await asyncio.wait_for(
@@ -163,57 +261,57 @@ class VoiceFriendlyPhishingApp:
                 timeout=10.0
             )
             if test_response:
-                print(f"   AI 응답 테스트: ✅ ({test_response[:30]}...)")
+                lines.append(f"   AI 응답 테스트: ✅ ({test_response[:30]}...)")
             else:
-                print("   AI 응답 테스트: ❌ (빈 응답)")
+                lines.append("   AI 응답 테스트: ❌ (빈 응답)")
                 
         except Exception as e:
-            print(f"   AI 두뇌: ❌ ({e})")
+            lines.append(f"   AI 두뇌: ❌ ({e})")
         
         # 오디오 매니저 테스트
         try:
             from services.audio_manager import audio_manager
-            print("   오디오 매니저 로드: ✅")
+            lines.append("   오디오 매니저 로드: ✅")
             
             init_result = audio_manager.initialize_output()
-            print(f"   오디오 초기화: {'✅' if init_result else '❌'}")
+            lines.append(f"   오디오 초기화: {'✅' if init_result else '❌'}")
             
         except Exception as e:
-            print(f"   오디오 매니저: ❌ ({e})")
+            lines.append(f"   오디오 매니저: ❌ ({e})")
         
         # STT 클라이언트 테스트
         try:
             from services.stream_stt import RTZROpenAPIClient
-            print("   STT 클라이언트 로드: ✅")
+            lines.append("   STT 클라이언트 로드: ✅")
             
             if settings.RETURNZERO_CLIENT_ID and settings.RETURNZERO_CLIENT_SECRET:
                 stt_client = RTZROpenAPIClient(
                     settings.RETURNZERO_CLIENT_ID, 
                     settings.RETURNZERO_CLIENT_SECRET
                 )
-                print("   STT 클라이언트 생성: ✅")
+                lines.append("   STT 클라이언트 생성: ✅")
             else:
-                print("   STT 클라이언트 생성: ❌ (API 키 없음)")
+                lines.append("   STT 클라이언트 생성: ❌ (API 키 없음)")
                 
         except Exception as e:
-            print(f"   STT 클라이언트: ❌ ({e})")
+            lines.append(f"   STT 클라이언트: ❌ ({e})")
         
-        print()
+        lines.append("")
+        self._emit_lines(lines)
 
     async def initialize(self):
         """애플리케이션 초기화"""
         
-        logger.info("=" * 50)
-        logger.info("🎙️ 음성 친화적 보이스피싱 상담 시스템")
-        logger.info("=" * 50)
+        logger.info("%s\n🎙️ 음성 친화적 보이스피싱 상담 시스템\n%s", "=" * 50, "=" * 50)
         
         self.start_time = datetime.now()
+        self._start_monotonic = time.monotonic()
         self.stats['start_time'] = self.start_time
         
         try:
             # 메모리 사용량 체크
             initial_memory_mb = self.initial_memory / 1024 / 1024
-            logger.info(f"🧠 초기 메모리: {initial_memory_mb:.1f} MB")
+            logger.info("🧠 초기 메모리: %.1f MB", initial_memory_mb)
             
             # 대화 매니저 생성
             logger.info("🎬 대화 매니저 생성 중...")
@@ -236,8 +334,8 @@ class VoiceFriendlyPhishingApp:
             )
             
             # 초기화 시간 측정
-            init_time = (datetime.now() - self.start_time).total_seconds()
-            logger.info(f"✅ 초기화 완료 ({init_time:.2f}초)")
+            init_time = time.monotonic() - self._start_monotonic
+            logger.info("✅ 초기화 완료 (%.2f초)", init_time)
             
             self.stats['initialization_success'] = True
             return True
@@ -251,7 +349,7 @@ class VoiceFriendlyPhishingApp:
         """메인 실행"""
         
         # 진단 실행 (디버그 모드에서)
-        if settings.DEBUG:
+        if self._debug:
             await self.run_diagnostics()
         
         # 초기화
@@ -261,6 +359,13 @@ class VoiceFriendlyPhishingApp:
         
         self.is_running = True
         
+        # 초기화 중 생성된 객체(모듈, 그래프, 클라이언트)는 이후 GC 스캔 대상에서 제외
+        gc.freeze()
+        
+        # 시그널 핸들러가 이벤트 루프로 종료를 넘길 수 있도록 루프/메인 태스크 보관
+        self._loop = asyncio.get_running_loop()
+        self._main_task = asyncio.current_task()
+        
         try:
             logger.info("🚀 음성 친화적 상담 시스템 시작")
             logger.info("💡 종료하려면 Ctrl+C를 누르세요")
@@ -270,7 +375,7 @@ class VoiceFriendlyPhishingApp:
             self._setup_signal_handlers()
             
             # 디버그 명령어 (선택적)
-            if settings.DEBUG:
+            if self._debug:
                 self._setup_debug_commands()
             
             # 메인 대화 시작
@@ -278,6 +383,8 @@ class VoiceFriendlyPhishingApp:
             
         except KeyboardInterrupt:
             logger.info("\n🛑 사용자에 의한 종료")
+        except asyncio.CancelledError:
+            logger.info("🛑 종료 신호로 대화 중단")
         except Exception as e:
             logger.error(f"❌ 실행 중 오류: {e}")
             self.stats['errors_encountered'].append(f"실행: {e}")
@@ -288,66 +395,129 @@ class VoiceFriendlyPhishingApp:
         """시그널 핸들러 설정"""
         
         def signal_handler(signum, frame):
-            logger.info(f"\n📶 종료 신호 수신 (신호: {signum})")
-            asyncio.create_task(self.cleanup())
-            import os
-            os._exit(0)
+            logger.info("\n📶 종료 신호 수신 (신호: %s)", signum)
+            # 시그널 프레임에서는 태스크를 만들지 않고 루프에 메인 태스크 취소만 예약
+            # (run()의 finally에서 cleanup이 실행된 뒤 정상 종료)
+            self._loop.call_soon_threadsafe(self._main_task.cancel)
         
         signal.signal(signal.SIGINT, signal_handler)
         if hasattr(signal, 'SIGTERM'):
             signal.signal(signal.SIGTERM, signal_handler)
 
     def _setup_debug_commands(self):
-        """디버그 명령어 설정"""
+        """디버그 명령어 설정 - POSIX TTY는 이벤트 루프의 stdin reader, 그 외(Windows)는 입력 스레드"""
+        
+        self._emit_lines([
+            "\n💡 디버그 모드 활성화",
+            "   명령어: 'stats', 'audio', 'ai', 'memory', 'help', 'quit'",
+            ""
+        ])
+        
+        if os.name == 'posix' and sys.stdin.isatty():
+            # 별도 스레드 없이 stdin이 읽기 가능해질 때 루프에서 바로 처리
+            self._stdin_buffer = b""
+            self._loop.add_reader(_STDIN_FD, self._on_stdin_readable)
+            self._stdin_reader_active = True
+            self._write_debug_prompt()
+            return
         
         def debug_worker():
-            print("\n💡 디버그 모드 활성화")
-            print("   명령어: 'stats', 'audio', 'ai', 'memory', 'help', 'quit'")
-            print()
-            
             while self.is_running:
                 try:
-                    cmd = input("debug> ").strip().lower()
-                    
-                    if cmd == 'quit' or cmd == 'exit':
-                        logger.info("디버그 명령으로 종료")
-                        self.is_running = False
-                        break
-                    
-                    elif cmd == 'stats':
-                        self._show_conversation_stats()
-                    
-                    elif cmd == 'audio':
-                        self._show_audio_stats()
-                    
-                    elif cmd == 'ai':
-                        self._show_ai_stats()
-                    
-                    elif cmd == 'memory':
-                        self._show_memory_stats()
-                    
-                    elif cmd == 'help':
-                        print("\n💡 사용 가능한 명령어:")
-                        print("   stats  - 대화 통계")
-                        print("   audio  - 오디오 상태")
-                        print("   ai     - AI 상태")
-                        print("   memory - 메모리 상태")
-                        print("   help   - 도움말")
-                        print("   quit   - 종료")
-                        print()
-                    
-                    elif cmd:
-                        print(f"알 수 없는 명령어: {cmd}")
-                        print("'help'를 입력하여 사용 가능한 명령어를 확인하세요.")
-                    
+                    cmd = input("debug> ")
+                    # 명령 처리는 루프 스레드에서 실행 (대화 매니저 상태를 루프 밖에서 건드리지 않음)
+                    self._loop.call_soon_threadsafe(self._handle_debug_command, cmd)
                 except (EOFError, KeyboardInterrupt):
                     break
                 except Exception as e:
-                    logger.debug(f"디버그 명령 오류: {e}")
+                    logger.debug("디버그 명령 오류: %s", e)
         
         debug_thread = threading.Thread(target=debug_worker, daemon=True, name="DebugConsole")
         debug_thread.start()
 
+    @staticmethod
+    def _write_debug_prompt():
+        sys.stdout.write("debug> ")
+        sys.stdout.flush()
+
+    def _on_stdin_readable(self):
+        """stdin 읽기 가능 콜백 (이벤트 루프에서 호출) - 완성된 줄 단위로 명령 처리"""
+        try:
+            data = os.read(_STDIN_FD, 4096)
+        except OSError as e:
+            logger.debug("디버그 입력 읽기 오류: %s", e)
+            data = b""
+        
+        if not data:  # EOF
+            self._remove_stdin_reader()
+            return
+        
+        self._stdin_buffer += data
+        *lines, self._stdin_buffer = self._stdin_buffer.split(b"\n")
+        
+        for line in lines:
+            self._handle_debug_command(line.decode('utf-8', errors='replace'))
+            if not self._stdin_reader_active:
+                return
+        
+        if lines:
+            self._write_debug_prompt()
+
+    def _remove_stdin_reader(self):
+        """stdin reader 해제"""
+        if self._stdin_reader_active:
+            self._stdin_reader_active = False
+            self._loop.remove_reader(_STDIN_FD)
+
+    def _handle_debug_command(self, raw_cmd: str):
+        """디버그 명령 한 줄 처리"""
+        try:
+            cmd = raw_cmd.strip().lower()
+            
+            if cmd == 'quit' or cmd == 'exit':
+                logger.info("디버그 명령으로 종료")
+                self.is_running = False
+                self._remove_stdin_reader()
+            
+            elif cmd == 'stats':
+                self._show_conversation_stats()
+            
+            elif cmd == 'audio':
+                self._show_audio_stats()
+            
+            elif cmd == 'ai':
+                self._show_ai_stats()
+            
+            elif cmd == 'memory':
+                self._show_memory_stats()
+            
+            elif cmd == 'help':
+                self._emit_lines([
+                    "\n💡 사용 가능한 명령어:",
+                    "   stats  - 대화 통계",
+                    "   audio  - 오디오 상태",
+                    "   ai     - AI 상태",
+                    "   memory - 메모리 상태",
+                    "   help   - 도움말",
+                    "   quit   - 종료",
+                    ""
+                ])
+            
+            elif cmd:
+                self._emit_lines([
+                    f"알 수 없는 명령어: {cmd}",
+                    "'help'를 입력하여 사용 가능한 명령어를 확인하세요."
+                ])
+        
+        except Exception as e:
+            logger.debug("디버그 명령 오류: %s", e)
+
+    @staticmethod
+    def _emit_lines(lines: list):
+        """여러 줄을 한 번의 write로 출력 (줄마다 flush되는 print 반복 방지)"""
+        sys.stdout.write("\n".join(lines) + "\n")
+        sys.stdout.flush()
+
     def _show_conversation_stats(self):
         """대화 통계 표시"""
         if not self.conversation_manager:
@@ -356,14 +526,9 @@ class VoiceFriendlyPhishingApp:
         
         try:
             status = self.conversation_manager.get_conversation_status()
-            print("\n📊 대화 통계:")
-            print(f"   상태: {status.get('state', 'unknown')}")
-            print(f"   실행 중: {status.get('is_running', False)}")
-            print(f"   처리 중: {status.get('is_processing', False)}")
-            print(f"   총 턴: {status.get('total_turns', 0)}")
-            print(f"   평균 응답시간: {status.get('avg_response_time', 0):.3f}초")
-            print(f"   오류 수: {status.get('error_count', 0)}")
-            print()
+            self._emit_lines([_CONVERSATION_STATS_FORMAT.format(
+                *(status.get(key, default) for key, default in _CONVERSATION_STATUS_KEYS)
+            )])
         except Exception as e:
             print(f"   통계 조회 오류: {e}")
 
@@ -375,10 +540,11 @@ class VoiceFriendlyPhishingApp:
         
         try:
             audio_status = self.conversation_manager.get_audio_status()
-            print("\n🎤 오디오 상태:")
+            lines = ["\n🎤 오디오 상태:"]
             for key, value in audio_status.items():
-                print(f"   {key}: {value}")
-            print()
+                lines.append(f"   {key}: {value}")
+            lines.append("")
+            self._emit_lines(lines)
         except Exception as e:
             print(f"   오디오 상태 조회 오류: {e}")
 
@@ -389,70 +555,77 @@ class VoiceFriendlyPhishingApp:
             return
         
         try:
+            lines = []
+            
             # AI 상태 조회
             if hasattr(self.conversation_manager.ai_brain, 'current_state'):
                 current_state = self.conversation_manager.ai_brain.current_state
                 if current_state:
                     summary = self.conversation_manager.ai_brain.get_conversation_summary(current_state)
-                    print("\n🤖 AI 상태:")
+                    lines.append("\n🤖 AI 상태:")
                     for key, value in summary.items():
-                        print(f"   {key}: {value}")
+                        lines.append(f"   {key}: {value}")
                 else:
-                    print("\n🤖 AI 상태: 대화 상태 없음")
+                    lines.append("\n🤖 AI 상태: 대화 상태 없음")
             else:
-                print("\n🤖 AI 상태: 상태 추적 불가")
+                lines.append("\n🤖 AI 상태: 상태 추적 불가")
             
             # 하이브리드 엔진 통계 (있는 경우)
             if hasattr(self.conversation_manager.ai_brain, 'decision_engine') and self.conversation_manager.ai_brain.decision_engine:
                 hybrid_stats = self.conversation_manager.ai_brain.decision_engine.get_performance_stats()
-                print("\n🔀 하이브리드 엔진:")
+                lines.append("\n🔀 하이브리드 엔진:")
                 for key, value in hybrid_stats.items():
-                    print(f"   {key}: {value}")
+                    lines.append(f"   {key}: {value}")
             
-            print()
+            lines.append("")
+            self._emit_lines(lines)
         except Exception as e:
             print(f"   AI 상태 조회 오류: {e}")
 
+    def _sampled_process_info(self, ttl: float = 0.5) -> tuple:
+        """프로세스 (rss, cpu%) 조회 - 짧은 TTL 동안은 이전 샘플 재사용 (시스템 콜 절약)"""
+        now = time.monotonic()
+        if self._process_info_cache and now - self._process_info_cache[2] < ttl:
+            return self._process_info_cache[:2]
+        
+        rss = self.process.memory_info().rss
+        cpu = self.process.cpu_percent(None)
+        self._process_info_cache = (rss, cpu, now)
+        return rss, cpu
+
     def _show_memory_stats(self):
         """메모리 통계 표시"""
         try:
-            current_memory = self.process.memory_info().rss / 1024 / 1024
+            rss, cpu = self._sampled_process_info()
+            current_memory = rss / 1024 / 1024
             memory_increase = current_memory - (self.initial_memory / 1024 / 1024)
             
-            print("\n🧠 메모리 상태:")
-            print(f"   초기 메모리: {self.initial_memory / 1024 / 1024:.1f} MB")
-            print(f"   현재 메모리: {current_memory:.1f} MB")
-            print(f"   증가량: {memory_increase:+.1f} MB")
-            print(f"   CPU 사용률: {self.process.cpu_percent():.1f}%")
-            print()
+            lines = ["\n🧠 메모리 상태:"]
+            lines.append(f"   초기 메모리: {self.initial_memory / 1024 / 1024:.1f} MB")
+            lines.append(f"   현재 메모리: {current_memory:.1f} MB")
+            lines.append(f"   증가량: {memory_increase:+.1f} MB")
+            lines.append(f"   CPU 사용률: {cpu:.1f}%")
+            lines.append("")
+            self._emit_lines(lines)
         except Exception as e:
             print(f"   메모리 상태 조회 오류: {e}")
 
     def _on_user_speech(self, text: str):
         """사용자 음성 콜백"""
-        display_text = text[:50] + "..." if len(text) > 50 else text
-        print(f"\n👤 사용자: {display_text}")
+        # 자르기는 %.50s 포맷으로 처리 (슬라이스 사본 없이 로깅 치환 시 한 번에, stdout 쓰기는 리스너 스레드)
+        console.info("\n👤 사용자: %.50s%s", text, "..." if len(text) > 50 else "")
 
     def _on_ai_response(self, response: str):
         """AI 응답 콜백"""
-        display_response = response[:80] + "..." if len(response) > 80 else response
-        print(f"\n🤖 상담원: {display_response}")
+        console.info("\n🤖 상담원: %.80s%s", response, "..." if len(response) > 80 else "")
 
     def _on_state_change(self, old_state, new_state):
         """상태 변경 콜백"""
-        if settings.DEBUG:
-            state_icons = {
-                "idle": "💤",
-                "listening": "👂", 
-                "processing": "🧠",
-                "speaking": "🗣️",
-                "error": "❌"
-            }
-            
-            old_icon = state_icons.get(old_state.value if hasattr(old_state, 'value') else str(old_state), "❓")
-            new_icon = state_icons.get(new_state.value if hasattr(new_state, 'value') else str(new_state), "❓")
+        if self._debug:
+            old_icon = _state_icon(getattr(old_state, 'value', old_state), "❓")
+            new_icon = _state_icon(getattr(new_state, 'value', new_state), "❓")
             
-            print(f"[{old_icon} → {new_icon}]", end=" ")
+            console.info("[%s → %s]", old_icon, new_icon)
 
     def _on_error(self, error: Exception):
         """오류 콜백"""
@@ -466,6 +639,9 @@ class VoiceFriendlyPhishingApp:
         try:
             self.is_running = False
             
+            # 디버그 stdin reader 해제
+            self._remove_stdin_reader()
+            
             # 대화 매니저 정리
             if self.conversation_manager:
                 await self.conversation_manager.cleanup()
@@ -473,41 +649,42 @@ class VoiceFriendlyPhishingApp:
             # 최종 통계 출력
             self._print_final_stats()
             
-            # 메모리 정리
-            gc.collect()
-            
             logger.info("✅ 정리 완료")
             
+            # 큐에 남은 로그 출력 후 리스너 정지
+            shutdown_logging()
+            
         except Exception as e:
             logger.error(f"정리 중 오류: {e}")
 
     def _print_final_stats(self):
         """최종 통계 출력"""
-        if not self.start_time:
+        # INFO가 꺼져 있으면 샘플링/포맷팅 자체를 생략
+        if not self.start_time or not logger.isEnabledFor(logging.INFO):
             return
         
-        total_runtime = (datetime.now() - self.start_time).total_seconds()
-        final_memory = self.process.memory_info().rss / 1024 / 1024
+        total_runtime = time.monotonic() - self._start_monotonic
         
-        logger.info("📈 === 최종 통계 ===")
-        logger.info(f"   실행 시간: {total_runtime/60:.1f}분")
-        logger.info(f"   최종 메모리: {final_memory:.1f}MB")
-        logger.info(f"   초기화 성공: {'✅' if self.stats['initialization_success'] else '❌'}")
+        # 여러 줄을 하나의 로그 레코드로 묶어 출력 (핸들러 호출/쓰기 1회)
+        lines = ["📈 === 최종 통계 ===", f"   실행 시간: {total_runtime / 60:.1f}분"]
+        lines.append(f"   최종 메모리: {self._sampled_process_info()[0] / 1024 / 1024:.1f}MB")
+        lines.append(f"   초기화 성공: {'✅' if self.stats['initialization_success'] else '❌'}")
         
         if self.stats['errors_encountered']:
-            logger.info("   발생한 오류:")
+            lines.append("   발생한 오류:")
             for error in self.stats['errors_encountered'][-5:]:  # 최근 5개만
-                logger.info(f"     - {error}")
+                lines.append(f"     - {error}")
         
         if self.conversation_manager:
             try:
                 conv_status = self.conversation_manager.get_conversation_status()
-                logger.info(f"   대화 턴: {conv_status.get('total_turns', 0)}")
-                logger.info(f"   평균 응답시간: {conv_status.get('avg_response_time', 0):.3f}초")
+                lines.append(f"   대화 턴: {conv_status.get('total_turns', 0)}")
+                lines.append(f"   평균 응답시간: {conv_status.get('avg_response_time', 0):.3f}초")
             except Exception:
                 pass
         
-        logger.info("=" * 20)
+        lines.append("=" * 20)
+        logger.info("\n".join(lines))
 
 async def main():
     """메인 함수"""
@@ -522,8 +699,10 @@ async def main():
 
 if __name__ == "__main__":
     try:
-        # Windows 최적화
-        if hasattr(asyncio, 'WindowsProactorEventLoopPolicy'):
+        # 이벤트 루프 선택: uvloop(POSIX) 우선, Windows는 Proactor 폴백
+        if UVLOOP_AVAILABLE:
+            uvloop.install()
+        elif hasattr(asyncio, 'WindowsProactorEventLoopPolicy'):
             asyncio.set_event_loop_policy(asyncio.WindowsProactorEventLoopPolicy())
         
         # 시작 메시지
@@ -39,7 +39,7 @@ class HighPerformanceAudioManager:
         # 성능 통계
         self.stats = {
             'total_played': 0,
-            'avg_latency': 0.0,
+            'total_latency': 0.0,  # 누적 지연시간 (평균은 조회 시 계산)
             'conversion_time': 0.0,
             'queue_overflows': 0
         }
@@ -133,13 +133,12 @@ class HighPerformanceAudioManager:
                 if not self.output_stream.is_active():
                     self.output_stream.start_stream()
                 
-                # 청크 단위로 재생 (지연 최소화)
+                # 청크 단위로 재생 (지연 최소화, memoryview 슬라이스로 복사 없이 전달)
                 chunk_size = self.audio_config['chunk_size'] * 2  # 16bit = 2bytes
+                pcm_view = memoryview(pcm_data)
                 
-                for i in range(0, len(pcm_data), chunk_size):
-                    chunk = pcm_data[i:i + chunk_size]
-                    if chunk:
-                        self.output_stream.write(chunk, exception_on_underflow=False)
+                for i in range(0, len(pcm_view), chunk_size):
+                    self.output_stream.write(pcm_view[i:i + chunk_size], exception_on_underflow=False)
                 
                 # 재생 완료 대기
                 self.output_stream.stop_stream()
@@ -334,17 +333,15 @@ class HighPerformanceAudioManager:
         """통계 업데이트"""
         
         self.stats['total_played'] += 1
-        
-        # 평균 지연시간 계산
-        current_avg = self.stats['avg_latency']
-        total_count = self.stats['total_played']
-        self.stats['avg_latency'] = (current_avg * (total_count - 1) + latency) / total_count
+        self.stats['total_latency'] += latency
     
     def get_performance_stats(self) -> dict:
         """성능 통계 조회"""
         
+        total_played = self.stats['total_played']
         return {
             **self.stats,
+            'avg_latency': self.stats['total_latency'] / total_played if total_played else 0.0,
             'is_playing': self.is_playing,
             'queue_size': self.play_queue.qsize(),
             'priority_queue_size': self.priority_queue.qsize(),
@@ -3,12 +3,17 @@
 """
 
 import asyncio
+import collections
+import contextlib
 import logging
+import random
+import re
+import sys
 import threading
 import time
-import queue
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Optional, Dict, Any, Callable, Protocol
+from typing import Optional, Dict, Any, Callable, Protocol, AsyncGenerator, List
 from enum import Enum
 
 from services.stream_stt import RTZROpenAPIClient
@@ -18,6 +23,79 @@ from services.audio_manager import audio_manager
 from config.settings import settings
 
 logger = logging.getLogger(__name__)
+console = logging.getLogger("console")  # 발화 표시용 (main의 메시지 전용 핸들러로 출력)
+
+# 메시지 dict 키/역할 문자열 (intern - 그래프 쪽 리터럴과 같은 객체라 == 비교가 포인터 비교로 끝남)
+_ROLE = sys.intern("role")
+_CONTENT = sys.intern("content")
+_ASSISTANT = sys.intern("assistant")
+
+# STT 재연결 백오프 (full jitter: uniform(0, min(CAP, BASE * 2^시도)))
+_STT_MAX_RETRIES = 5
+_STT_BACKOFF_BASE = 0.5
+_STT_BACKOFF_CAP = 8.0
+
+# 메시지 기록 윈도우: 앞쪽 HEAD개(인사/모드 선택) + 이전 대화 요약 1개 + 최근 WINDOW개만 유지
+_HISTORY_HEAD = 2
+_HISTORY_WINDOW = 8
+_HISTORY_SUMMARY_PREFIX = "[이전 대화 요약] "
+_HISTORY_SUMMARY_MAX_CHARS = 300  # LLM 요약 실패 시 추출 요약 길이 상한
+
+# 문장 경계 (문장 단위 TTS 파이프라인용)
+_SENTENCE_BOUNDARY = re.compile(r"(?<=[.!?。])\s+|\n+")
+# 긴 문장은 쉼표 구간(최소 단어 수 이상)으로 한 번 더 나눠 첫 음성까지의 합성 시간 단축
+_CLAUSE_BOUNDARY = re.compile(r"(?<=,)\s+")
+_TTS_CHUNK_MAX_CHARS = 80
+_CLAUSE_MIN_WORDS = 4
+
+def _split_for_tts(text: str) -> List[str]:
+    """TTS 파이프라인용 분할 (문장 경계 → 긴 문장은 쉼표 구간)"""
+    chunks: List[str] = []
+    for sentence in _SENTENCE_BOUNDARY.split(text.strip()):
+        if not sentence:
+            continue
+        if len(sentence) <= _TTS_CHUNK_MAX_CHARS:
+            chunks.append(sentence)
+            continue
+        
+        first = len(chunks)
+        buf = ""
+        for clause in _CLAUSE_BOUNDARY.split(sentence):
+            buf = f"{buf} {clause}" if buf else clause
+            if len(buf.split()) >= _CLAUSE_MIN_WORDS:
+                chunks.append(buf)
+                buf = ""
+        if buf:
+            # 짧은 꼬리 구간은 같은 문장의 앞 구간에 붙임
+            if len(chunks) > first:
+                chunks[-1] = f"{chunks[-1]} {buf}"
+            else:
+                chunks.append(buf)
+    return chunks
+
+# 장애 시 안내 문구 (초기화 후 미리 합성해 두고 오류 시 TTS 호출 없이 재생)
+_ERROR_FALLBACK_RESPONSE = "일시적 문제가 발생했습니다. 132번으로 연락주세요."
+_FALLBACK_GREETING = "안녕하세요. 보이스피싱 상담센터입니다. 1번 또는 2번을 선택해주세요."
+
+# AI 두뇌(그래프 빌드 포함)는 프로세스당 한 번만 생성해 재사용
+# 세션별 상태는 ai_brain.cleanup()에서 초기화되므로 순차 대화 간 공유 가능 (동시 대화는 지원하지 않음)
+_AI_BRAIN_SINGLETON: Optional[VoiceFriendlyPhishingGraph] = None
+_AI_BRAIN_LOCK = threading.Lock()
+
+def _get_ai_brain() -> VoiceFriendlyPhishingGraph:
+    """공유 AI 두뇌 가져오기 (최초 호출 시 생성)"""
+    global _AI_BRAIN_SINGLETON
+    brain = _AI_BRAIN_SINGLETON
+    if brain is None:
+        with _AI_BRAIN_LOCK:
+            brain = _AI_BRAIN_SINGLETON
+            if brain is None:
+                brain = _AI_BRAIN_SINGLETON = VoiceFriendlyPhishingGraph(debug=settings.DEBUG)
+    return brain
+
+async def _single_chunk_stream(audio_data: bytes) -> AsyncGenerator[bytes, None]:
+    """합성 완료된 오디오를 play_audio_stream 입력 형태로 감싸기"""
+    yield audio_data
 
 class ConversationState(Enum):
     """대화 상태"""
@@ -27,24 +105,59 @@ class ConversationState(Enum):
     SPEAKING = "speaking"
     ERROR = "error"
 
+# 허용되는 상태 전이 (그 외 전이는 무시하고 경고)
+_STATE_TRANSITIONS = {
+    ConversationState.IDLE: frozenset({ConversationState.LISTENING, ConversationState.SPEAKING, ConversationState.ERROR}),
+    ConversationState.LISTENING: frozenset({ConversationState.PROCESSING, ConversationState.SPEAKING, ConversationState.IDLE, ConversationState.ERROR}),
+    ConversationState.PROCESSING: frozenset({ConversationState.SPEAKING, ConversationState.LISTENING, ConversationState.IDLE, ConversationState.ERROR}),
+    ConversationState.SPEAKING: frozenset({ConversationState.LISTENING, ConversationState.IDLE, ConversationState.ERROR}),
+    ConversationState.ERROR: frozenset({ConversationState.LISTENING, ConversationState.IDLE}),
+}
+
 class FixedVoiceFriendlyConversationManager:
     """
     수정된 음성 대화 매니저 - 올바른 LangGraph 노드 실행
     """
     
+    __slots__ = (
+        "client_id", "client_secret",
+        "ai_brain", "_is_complete_fn", "tts_service", "audio_manager", "stt_client",
+        "stt_queue", "_stt_executor", "_stt_future", "_loop", "_shutdown_evt", "_input_evt",
+        "_greeting_task", "_fallback_audio", "_fallback_task", "_conversation_complete",
+        "state", "is_running", "is_processing", "initialization_complete", "error_count",
+        "session_id", "current_graph_state", "_last_assistant_msg",
+        "_history_summary", "_summary_pending", "_summary_task",
+        "callbacks", "_cb_user", "_cb_ai", "_cb_state", "_cb_err",
+        "stats", "_start_monotonic",
+    )
+    
     def __init__(self, client_id: str, client_secret: str):
         self.client_id = client_id
         self.client_secret = client_secret
         
         # 🔥 핵심: AI 두뇌를 올바르게 사용
-        self.ai_brain = VoiceFriendlyPhishingGraph(debug=settings.DEBUG)
+        self.ai_brain = _get_ai_brain()
+        # 완료 확인 메서드는 한 번만 조회해 두고 턴마다 바로 호출
+        self._is_complete_fn: Optional[Callable[[], bool]] = getattr(self.ai_brain, 'is_conversation_complete', None)
         self.tts_service = tts_service
         self.audio_manager = audio_manager
         
         # STT 컴포넌트
         self.stt_client = None
-        self.stt_queue = queue.Queue(maxsize=5)
-        self.stt_thread: Optional[threading.Thread] = None
+        self.stt_queue: collections.deque = collections.deque(maxlen=5)  # 가득 차면 가장 오래된 입력 자동 폐기
+        self._stt_executor: Optional[ThreadPoolExecutor] = None  # STT 전용 단일 워커 (start 시 생성)
+        self._stt_future: Optional[asyncio.Future] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None  # STT 스레드 → 루프 전달용
+        self._shutdown_evt = threading.Event()  # STT 재시도 대기를 종료 시 즉시 깨움
+        self._input_evt = asyncio.Event()  # 새 STT 입력 도착 (입력 대기/오류 백오프 해제용)
+        
+        # 초기 인사 TTS는 STT 스트림 연결과 겹쳐서 진행
+        self._greeting_task: Optional[asyncio.Task] = None
+        # 미리 합성한 폴백 오디오 (문구 → 오디오 bytes)
+        self._fallback_audio: Dict[str, bytes] = {}
+        self._fallback_task: Optional[asyncio.Task] = None
+        # 대화 완료 여부는 턴이 끝날 때만 갱신 (유휴 루프에서 매번 조회하지 않음)
+        self._conversation_complete = False
 
         # 상태 관리
         self.state = ConversationState.IDLE
@@ -56,6 +169,11 @@ class FixedVoiceFriendlyConversationManager:
         # 🔥 핵심: LangGraph 상태 관리
         self.current_graph_state = None
         self.session_id = None
+        self._last_assistant_msg: Optional[str] = None  # 상태 갱신 시 한 번만 추출
+        # 윈도우 밖으로 밀려난 메시지 요약 (LLM 요약은 백그라운드에서 갱신, 다음 정리 때 반영)
+        self._history_summary = ""
+        self._summary_pending: List[Dict[str, Any]] = []  # 아직 요약에 반영되지 않은 메시지
+        self._summary_task: Optional[asyncio.Task] = None
 
         # 콜백 관리
         self.callbacks: Dict[str, Optional[Callable]] = {
@@ -64,50 +182,67 @@ class FixedVoiceFriendlyConversationManager:
             'on_state_change': None,
             'on_error': None
         }
+        # 핫 경로용 콜백 슬롯 (set_callbacks에서 dict와 함께 갱신)
+        self._cb_user = self._cb_ai = self._cb_state = self._cb_err = None
         
         # 성능 통계
         self.stats = {
             'conversation_start_time': None,
             'initialization_attempts': 0,
             'total_pipeline_runs': 0,
-            'avg_pipeline_time': 0.0,
+            'total_pipeline_ns': 0,  # 누적 처리 시간 (정수 ns, 평균은 조회 시 계산)
             'stt_errors': 0,
             'ai_errors': 0,
             'tts_errors': 0,
         }
+        # 경과 시간 계산용 단조 시계 기준점 (상태 조회마다 datetime 연산 방지)
+        self._start_monotonic: Optional[float] = None
         
         logger.info("✅ 수정된 대화 매니저 초기화 완료")
 
     async def initialize(self) -> bool:
         """개선된 파이프라인 초기화"""
         self.stats['initialization_attempts'] += 1
-        logger.info(f"🎬 음성 대화 파이프라인 초기화 (시도 {self.stats['initialization_attempts']})...")
+        logger.info("🎬 음성 대화 파이프라인 초기화 (시도 %d)...", self.stats['initialization_attempts'])
         
         try:
-            # 1. 오디오 매니저 초기화
-            logger.info("🔊 오디오 매니저 초기화 중...")
-            if not self.audio_manager.initialize_output():
+            self._loop = asyncio.get_running_loop()
+            
+            # 1~3. 오디오 출력 / STT 클라이언트 / LangGraph 세션은 서로 독립적이므로 동시에 준비
+            logger.info("🔊 오디오 매니저 / 🎤 STT 클라이언트 / 🧠 LangGraph 세션 준비 중...")
+            self.session_id = f"voice_{time.time_ns():x}"
+            audio_ok, stt_client, graph_state = await asyncio.gather(
+                asyncio.to_thread(self.audio_manager.initialize_output),
+                asyncio.to_thread(RTZROpenAPIClient, self.client_id, self.client_secret),
+                self.ai_brain.start_conversation(self.session_id),
+                return_exceptions=True,
+            )
+            
+            if isinstance(audio_ok, BaseException) or not audio_ok:
                 logger.error("❌ 오디오 파이프라인 실패")
                 return False
             logger.info("✅ 오디오 파이프라인 준비")
             
-            # 2. STT 클라이언트 생성
-            logger.info("🎤 STT 클라이언트 생성 중...")
-            self.stt_client = RTZROpenAPIClient(self.client_id, self.client_secret)
+            if isinstance(stt_client, BaseException):
+                raise stt_client
+            self.stt_client = stt_client
             logger.info("✅ STT 클라이언트 준비")
             
-            # 🔥 핵심 수정: LangGraph 세션 시작
-            logger.info("🧠 LangGraph 세션 시작 중...")
-            self.session_id = f"voice_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
-            self.current_graph_state = await self.ai_brain.start_conversation(self.session_id)
-            logger.info(f"✅ LangGraph 세션 시작: {self.session_id}")
+            if isinstance(graph_state, BaseException):
+                raise graph_state
+            self.current_graph_state = graph_state
+            self._history_summary = ""
+            self._summary_pending = []
+            self._refresh_last_assistant_msg()
+            logger.info("✅ LangGraph 세션 시작: %s", self.session_id)
             
-            # 4. 초기 인사 (LangGraph에서 생성된 메시지 사용)
-            await self._deliver_langgraph_greeting()
+            # 4. 초기 인사 (LangGraph에서 생성된 메시지 사용 - 첫 TTS 호출이 연결 예열 역할)
+            #    완료는 start_conversation에서 STT 시작 후 대기 (토큰 발급/gRPC 연결이 인사 재생과 겹침)
+            self._greeting_task = asyncio.create_task(self._deliver_langgraph_greeting())
             
             self.initialization_complete = True
             self.stats['conversation_start_time'] = datetime.now()
-            self._set_state(ConversationState.LISTENING)
+            self._start_monotonic = time.monotonic()
             
             logger.info("🎉 파이프라인 초기화 완료!")
             return True
@@ -119,25 +254,32 @@ class FixedVoiceFriendlyConversationManager:
     async def _deliver_langgraph_greeting(self):
         """LangGraph에서 생성된 초기 인사 전달"""
         try:
-            # LangGraph 상태에서 마지막 AI 메시지 가져오기
-            if self.current_graph_state and self.current_graph_state.get("messages"):
-                messages = self.current_graph_state["messages"]
-                for msg in reversed(messages):
-                    if msg.get("role") == "assistant":
-                        greeting_text = msg.get("content", "")
-                        if greeting_text:
-                            await self._safe_tts_delivery(greeting_text)
-                            logger.info("✅ LangGraph 초기 인사 전달 완료")
-                            return
+            # LangGraph 상태에서 마지막 AI 메시지 가져오기 (세션 시작 시 추출됨)
+            greeting_text = self._last_assistant_msg
+            if greeting_text:
+                await self._safe_tts_delivery(greeting_text)
+                logger.info("✅ LangGraph 초기 인사 전달 완료")
+                return
             
             # 폴백: 기본 인사
-            fallback_greeting = "안녕하세요. 보이스피싱 상담센터입니다. 1번 또는 2번을 선택해주세요."
-            await self._safe_tts_delivery(fallback_greeting)
+            await self._safe_tts_delivery(_FALLBACK_GREETING)
             logger.warning("⚠️ LangGraph 인사 없음 - 폴백 사용")
             
         except Exception as e:
             logger.error(f"초기 인사 전달 실패: {e}")
 
+    async def _prepare_fallback_audio(self):
+        """오류 안내 문구를 미리 합성 (장애 상황에서 TTS 지연/실패 방지)"""
+        if not self.tts_service.is_enabled:
+            return
+        try:
+            audio_data = await self.tts_service.text_to_speech_file(_ERROR_FALLBACK_RESPONSE)
+            if audio_data:
+                self._fallback_audio[_ERROR_FALLBACK_RESPONSE] = audio_data
+                logger.debug("폴백 오디오 준비 완료 (%d bytes)", len(audio_data))
+        except Exception as e:
+            logger.debug("폴백 오디오 사전 합성 실패 (무시됨): %s", e)
+
     async def start_conversation(self):
         """대화 시작"""
         if not await self.initialize():
@@ -148,9 +290,16 @@ class FixedVoiceFriendlyConversationManager:
         logger.info("🎙️ 음성 대화 시작")
         
         try:
-            # STT 입력 시작
+            # STT 입력 시작 (인사 재생과 스트림 연결을 겹쳐 첫 응답 대기 단축)
             self._start_stt_input_safe()
             
+            if self._greeting_task is not None:
+                await self._greeting_task
+            self._set_state(ConversationState.LISTENING)
+            
+            # 인사와 TTS 경쟁하지 않도록 인사 후 백그라운드에서 폴백 오디오 준비
+            self._fallback_task = asyncio.create_task(self._prepare_fallback_audio())
+            
             # 메인 루프
             await self._safe_main_loop()
             
@@ -165,11 +314,11 @@ class FixedVoiceFriendlyConversationManager:
         """안전한 STT 입력 시작"""
         def stt_worker():
             retry_count = 0
-            max_retries = 3
+            max_retries = _STT_MAX_RETRIES
             
             while self.is_running and retry_count < max_retries:
                 try:
-                    logger.info(f"🎤 STT 스트림 시작 시도 {retry_count + 1}/{max_retries}")
+                    logger.info("🎤 STT 스트림 시작 시도 %d/%d", retry_count + 1, max_retries)
                     
                     if self.stt_client:
                         self.stt_client.reset_stream()
@@ -178,8 +327,9 @@ class FixedVoiceFriendlyConversationManager:
                         if is_final and transcript.alternatives:
                             text = transcript.alternatives[0].text.strip()
                             if text and len(text) > 1:
-                                self._safe_add_to_queue(text)
-                                logger.debug(f"🎤 STT 입력: {text}")
+                                # 큐 조작은 루프 스레드에서 (대기 중인 메인 루프를 즉시 깨움)
+                                self._loop.call_soon_threadsafe(self._safe_add_to_queue, text)
+                                logger.debug("🎤 STT 입력: %s", text)
                     
                     self.stt_client.print_transcript = transcript_handler
                     self.stt_client.transcribe_streaming_grpc()
@@ -193,33 +343,33 @@ class FixedVoiceFriendlyConversationManager:
                     logger.error(f"STT 스트림 오류 (시도 {retry_count}): {e}")
                     
                     if retry_count < max_retries:
-                        logger.info(f"🔄 {retry_count + 1}초 후 STT 재시도...")
-                        time.sleep(retry_count + 1)
+                        delay = random.uniform(0, min(_STT_BACKOFF_CAP, _STT_BACKOFF_BASE * (2 ** retry_count)))
+                        logger.info("🔄 %.1f초 후 STT 재시도...", delay)
+                        if self._shutdown_evt.wait(delay):
+                            break  # 대기 중 종료 요청
                     else:
                         logger.error("❌ STT 스트림 최대 재시도 횟수 초과")
                         break
         
-        self.stt_thread = threading.Thread(
-            target=stt_worker, 
-            daemon=True, 
-            name="STT-Worker"
-        )
-        self.stt_thread.start()
-        logger.info("🎤 STT 워커 스레드 시작됨")
+        self._shutdown_evt.clear()
+        if self._stt_executor is None:
+            self._stt_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="STT")
+        self._stt_future = self._loop.run_in_executor(self._stt_executor, stt_worker)
+        logger.info("🎤 STT 워커 시작됨")
 
     def _safe_add_to_queue(self, text: str):
-        """안전한 큐 추가"""
-        try:
-            if not self.stt_queue.full():
-                self.stt_queue.put_nowait(text)
-            else:
-                try:
-                    self.stt_queue.get_nowait()
-                    self.stt_queue.put_nowait(text)
-                except queue.Empty:
-                    pass
-        except Exception as e:
-            logger.warning(f"큐 추가 오류: {e}")
+        """안전한 큐 추가 (루프 스레드에서 호출, 가득 차면 deque가 가장 오래된 입력 버림)"""
+        if not self.is_running:
+            # 정리 시작 후 도착한 콜백 (call_soon_threadsafe로 예약된 것)이 큐를 다시 채우지 않도록
+            return
+        if self._greeting_task is not None and not self._greeting_task.done():
+            # 인사 재생 중 인식 결과는 스피커 소리가 섞일 수 있어 버림
+            logger.debug("인사 재생 중 입력 무시: %s", text)
+            return
+        if len(self.stt_queue) == self.stt_queue.maxlen:
+            logger.warning("STT 큐 가득참 - 가장 오래된 입력 버림: %s", self.stt_queue[0])
+        self.stt_queue.append(text)
+        self._input_evt.set()
 
     async def _safe_main_loop(self):
         """안전한 메인 루프"""
@@ -230,20 +380,19 @@ class FixedVoiceFriendlyConversationManager:
         
         while self.is_running:
             try:
-                # STT 입력 확인
-                user_input = self._get_stt_input()
+                # STT 입력 대기 (폴링 없이 입력 도착 시 바로 깨어남)
+                user_input = await self._get_stt_input()
                 
-                if user_input and not self.is_processing:
-                    logger.info(f"👤 사용자 입력 감지: {user_input}")
+                if user_input:
+                    logger.info("👤 사용자 입력 감지: %s", user_input)
                     # 🔥 핵심: LangGraph 노드 시스템 사용
                     await self._process_through_langgraph(user_input)
                 
-                # 대화 완료 확인
-                if self._check_conversation_complete():
+                # 대화 완료 확인 (턴 처리 후 갱신된 플래그)
+                if self._conversation_complete:
                     logger.info("✅ 대화 완료 신호 감지")
                     break
                 
-                await asyncio.sleep(0.1)
                 consecutive_errors = 0
                         
             except Exception as e:
@@ -254,13 +403,26 @@ class FixedVoiceFriendlyConversationManager:
                     logger.error("❌ 메인 루프 연속 오류 한계 초과")
                     break
                 
-                await asyncio.sleep(min(consecutive_errors * 0.5, 3.0))
+                # 지수 백오프 (최대 3초) - 대기 중 새 입력이 오면 즉시 재개
+                if not self.stt_queue:
+                    self._input_evt.clear()
+                    try:
+                        await asyncio.wait_for(
+                            self._input_evt.wait(),
+                            timeout=min(0.25 * (2 ** consecutive_errors), 3.0)
+                        )
+                    except asyncio.TimeoutError:
+                        pass
 
-    def _get_stt_input(self) -> Optional[str]:
-        """STT 큐에서 입력 가져오기"""
+    async def _get_stt_input(self) -> Optional[str]:
+        """STT 큐에서 입력 가져오기 (비어 있으면 입력 이벤트 대기, 종료로 깨어나면 None)"""
+        if not self.stt_queue:
+            self._input_evt.clear()
+            await self._input_evt.wait()
+        
         try:
-            return self.stt_queue.get_nowait()
-        except queue.Empty:
+            return self.stt_queue.popleft()
+        except IndexError:
             return None
 
     async def _process_through_langgraph(self, user_input: str):
@@ -268,34 +430,39 @@ class FixedVoiceFriendlyConversationManager:
         self.is_processing = True
         self._set_state(ConversationState.PROCESSING)
         
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
         
         try:
             # 사용자 입력 콜백
-            if self.callbacks['on_user_speech']:
+            cb = self._cb_user
+            if cb is not None:
                 try:
-                    self.callbacks['on_user_speech'](user_input)
+                    cb(user_input)
                 except Exception as e:
                     logger.warning(f"사용자 입력 콜백 오류: {e}")
             
             # 🔥 핵심: LangGraph의 continue_conversation 사용
             logger.info("🧠 LangGraph 노드 시스템으로 처리 중...")
             
+            self._trim_message_history()
             self.current_graph_state = await self.ai_brain.continue_conversation(
                 self.current_graph_state, 
                 user_input
             )
+            self._refresh_last_assistant_msg()
+            self._conversation_complete = self._check_conversation_complete()
             
             # 🔥 핵심: LangGraph 상태에서 AI 응답 추출
             ai_response = self._extract_latest_ai_response()
             
             if ai_response:
-                logger.info(f"🤖 LangGraph AI 응답: {ai_response}")
+                logger.info("🤖 LangGraph AI 응답: %s", ai_response)
                 
                 # AI 응답 콜백
-                if self.callbacks['on_ai_response']:
+                cb = self._cb_ai
+                if cb is not None:
                     try:
-                        self.callbacks['on_ai_response'](ai_response)
+                        cb(ai_response)
                     except Exception as e:
                         logger.warning(f"AI 응답 콜백 오류: {e}")
                 
@@ -305,8 +472,7 @@ class FixedVoiceFriendlyConversationManager:
                 logger.warning("LangGraph에서 AI 응답을 생성하지 못함")
             
             # 통계 업데이트
-            processing_time = time.time() - start_time
-            self._update_pipeline_stats(processing_time)
+            self._update_pipeline_stats(time.perf_counter_ns() - start_ns)
             
         except Exception as e:
             logger.error(f"LangGraph 처리 오류: {e}")
@@ -315,26 +481,94 @@ class FixedVoiceFriendlyConversationManager:
             self.is_processing = False
             self._set_state(ConversationState.LISTENING)
 
-    def _extract_latest_ai_response(self) -> Optional[str]:
-        """LangGraph 상태에서 최신 AI 응답 추출"""
+    def _trim_message_history(self):
+        """메시지 기록을 고정 윈도우로 유지 - 밀려난 메시지는 요약 메시지 1개로 압축"""
+        messages = self.current_graph_state.get("messages") if self.current_graph_state else None
+        if not messages:
+            return
+        
+        has_summary = len(messages) > _HISTORY_HEAD and str(
+            messages[_HISTORY_HEAD].get(_CONTENT, "")
+        ).startswith(_HISTORY_SUMMARY_PREFIX)
+        start = _HISTORY_HEAD + (1 if has_summary else 0)  # 헤드 + 기존 요약 다음부터
+        excess = len(messages) - start - _HISTORY_WINDOW
+        if excess <= 0:
+            return
+        
+        self._summary_pending.extend(messages[start:start + excess])
+        summary = {
+            "role": "system",
+            "content": _HISTORY_SUMMARY_PREFIX + self._extractive_summary(self._summary_pending),
+            "timestamp": datetime.now()
+        }
+        # 그래프가 넘겨준 리스트는 수정하지 않고 새 리스트로 교체
+        self.current_graph_state["messages"] = [
+            *messages[:_HISTORY_HEAD], summary, *messages[start + excess:]
+        ]
+        
+        if self._summary_task is None or self._summary_task.done():
+            self._summary_task = asyncio.create_task(self._refresh_history_summary())
+
+    def _extractive_summary(self, pending: List[Dict[str, Any]]) -> str:
+        """추출 요약 (캐시된 요약 + 아직 요약되지 않은 사용자 발화, LLM 요약 전/실패 시 사용)"""
+        user_lines = [m.get(_CONTENT, "") for m in pending if m.get(_ROLE) == "user"]
+        text = " / ".join(filter(None, [self._history_summary, *user_lines]))
+        return text[-_HISTORY_SUMMARY_MAX_CHARS:]
+
+    async def _refresh_history_summary(self):
+        """밀려난 메시지를 기존 요약과 합쳐 한 문장으로 재요약 (턴 처리 경로 밖에서 실행)"""
+        pending = self._summary_pending[:]
+        if not pending:
+            return
+        
+        transcript = "\n".join(
+            f"{'사용자' if m.get(_ROLE) == 'user' else '상담원'}: {m.get(_CONTENT, '')}"
+            for m in pending
+        )
+        if self._history_summary:
+            transcript = f"(앞선 요약) {self._history_summary}\n{transcript}"
+        
+        try:
+            from services.gemini_assistant import gemini_assistant
+            summary = await gemini_assistant.summarize_conversation(transcript, max_sentences=1)
+        except Exception as e:
+            logger.debug("대화 요약 실패 (추출 요약 사용): %s", e)
+            summary = ""
+        
+        # 요약에 반영된 메시지만 대기 목록에서 제거 (요약 중 추가된 메시지는 다음 갱신 때 반영)
+        self._history_summary = summary.strip() if summary else self._extractive_summary(pending)
+        del self._summary_pending[:len(pending)]
+
+    def _refresh_last_assistant_msg(self):
+        """상태 갱신 직후 한 번만 마지막 AI 메시지 추출 (응답은 보통 마지막 메시지라 즉시 발견)"""
+        self._last_assistant_msg = None
         try:
-            if not self.current_graph_state or not self.current_graph_state.get("messages"):
-                return None
+            messages = (self.current_graph_state or {}).get("messages") or ()
+            if not messages:
+                return
             
-            messages = self.current_graph_state["messages"]
+            # 그래프는 응답을 마지막에 추가하므로 끝 메시지부터 바로 확인
+            tail = messages[-1]
+            if tail.get(_ROLE) == _ASSISTANT:
+                content = tail.get(_CONTENT, "").strip()
+                if content:
+                    self._last_assistant_msg = content
+                    return
             
-            # 마지막 AI 메시지 찾기
+            # 폴백: 끝이 AI 메시지가 아닌 경우에만 역순 탐색
             for msg in reversed(messages):
-                if msg.get("role") == "assistant":
-                    content = msg.get("content", "").strip()
+                if msg.get(_ROLE) == _ASSISTANT:
+                    content = msg.get(_CONTENT, "").strip()
                     if content:
-                        return content
-            
-            return None
-            
+                        self._last_assistant_msg = content
+                        return
+                    
         except Exception as e:
             logger.error(f"AI 응답 추출 오류: {e}")
-            return None
+
+    def _extract_latest_ai_response(self) -> Optional[str]:
+        """LangGraph 상태에서 최신 AI 응답 추출 (캐시된 값)"""
+        return self._last_assistant_msg
 
     async def _safe_tts_delivery(self, response_text: str):
         """안전한 TTS 전달"""
@@ -342,63 +576,117 @@ class FixedVoiceFriendlyConversationManager:
         
         try:
             if not self.tts_service.is_enabled:
-                print(f"🤖 {response_text}")
+                console.info("🤖 %s", response_text)
                 return
             
             try:
-                audio_stream = self.tts_service.text_to_speech_stream(response_text)
-                await self.audio_manager.play_audio_stream(audio_stream)
+                cached_audio = self._fallback_audio.get(response_text)
+                sentences = () if cached_audio else _split_for_tts(response_text)
+                
+                if cached_audio:
+                    await self.audio_manager.play_audio_stream(_single_chunk_stream(cached_audio))
+                elif len(sentences) > 1:
+                    # 여러 문장: 첫 문장 합성 직후 재생 시작, 재생 중 다음 문장 합성
+                    await self._pipelined_tts_delivery(sentences)
+                else:
+                    audio_stream = self.tts_service.text_to_speech_stream(response_text)
+                    await self.audio_manager.play_audio_stream(audio_stream)
                 
             except Exception as tts_error:
                 logger.error(f"TTS 처리 오류: {tts_error}")
-                print(f"🤖 {response_text}")
+                console.info("🤖 %s", response_text)
                 self.stats['tts_errors'] += 1
                 
         except Exception as e:
             logger.error(f"TTS 전달 오류: {e}")
-            print(f"🤖 {response_text}")
+            console.info("🤖 %s", response_text)
+
+    async def _pipelined_tts_delivery(self, sentences: List[str]):
+        """문장 단위 TTS 전달 - 생산자(합성)/소비자(재생) 큐로 합성과 재생을 겹침"""
+        # 재생 중에도 다음 문장을 미리 합성 (최대 2문장 선행)
+        audio_queue: asyncio.Queue = asyncio.Queue(maxsize=2)
+        
+        async def producer():
+            try:
+                for sentence in sentences:
+                    audio_data = await self.tts_service.text_to_speech_file(sentence)
+                    if audio_data:
+                        await audio_queue.put(audio_data)
+                    else:
+                        console.info("🤖 %s", sentence)
+            except asyncio.CancelledError:
+                raise  # 소비자가 중단됨 - 큐를 읽을 쪽이 없으므로 종료 신호 생략
+            except Exception:
+                await audio_queue.put(None)  # 소비자는 아직 대기 중 - 깨운 뒤 오류 전달
+                raise
+            await audio_queue.put(None)
+        
+        producer_task = asyncio.create_task(producer())
+        try:
+            while True:
+                audio_data = await audio_queue.get()
+                if audio_data is None:
+                    break
+                await self.audio_manager.play_audio_stream(_single_chunk_stream(audio_data))
+        except BaseException:
+            # 재생 오류/취소 시 생산자도 정리 (호출이 끝난 뒤 남는 태스크 없도록)
+            producer_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError, Exception):
+                await producer_task
+            raise
+        
+        # 합성 쪽 오류는 호출자의 폴백 처리로 전달
+        await producer_task
 
     def _check_conversation_complete(self) -> bool:
         """대화 완료 여부 확인"""
+        is_complete = self._is_complete_fn
+        if is_complete is None:
+            return False
         try:
             # 🔥 핵심: LangGraph AI 두뇌의 완료 여부 확인
-            return self.ai_brain.is_conversation_complete()
+            return is_complete()
         except Exception as e:
-            logger.debug(f"대화 완료 확인 오류 (무시됨): {e}")
+            logger.debug("대화 완료 확인 오류 (무시됨): %s", e)
             return False
 
     async def _handle_processing_error(self, error: Exception):
         """처리 오류 핸들링"""
         self.error_count += 1
         
-        if self.callbacks['on_error']:
+        cb = self._cb_err
+        if cb is not None:
             try:
-                self.callbacks['on_error'](error)
+                cb(error)
             except Exception:
                 pass
         
-        fallback_response = "일시적 문제가 발생했습니다. 132번으로 연락주세요."
-        await self._safe_tts_delivery(fallback_response)
+        await self._safe_tts_delivery(_ERROR_FALLBACK_RESPONSE)
 
-    def _update_pipeline_stats(self, processing_time: float):
+    def _update_pipeline_stats(self, processing_ns: int):
         """파이프라인 통계 업데이트"""
         self.stats['total_pipeline_runs'] += 1
         
-        current_avg = self.stats['avg_pipeline_time']
+        self.stats['total_pipeline_ns'] += processing_ns
+
+    def _avg_pipeline_time(self) -> float:
+        """평균 파이프라인 처리 시간 (조회 시에만 나눗셈)"""
         total_runs = self.stats['total_pipeline_runs']
-        self.stats['avg_pipeline_time'] = (
-            (current_avg * (total_runs - 1) + processing_time) / total_runs
-        )
+        return self.stats['total_pipeline_ns'] / total_runs * 1e-9 if total_runs else 0.0
 
     def _set_state(self, new_state: ConversationState):
-        """상태 변경"""
-        if self.state != new_state:
-            old_state = self.state
+        """상태 변경 (전이 표에 없는 전이는 거부)"""
+        old_state = self.state
+        if old_state is not new_state:
+            if new_state not in _STATE_TRANSITIONS[old_state]:
+                logger.warning("잘못된 상태 전이 무시: %s → %s", old_state.value, new_state.value)
+                return
             self.state = new_state
             
-            if self.callbacks['on_state_change']:
+            cb = self._cb_state
+            if cb is not None:
                 try:
-                    self.callbacks['on_state_change'](old_state, new_state)
+                    cb(old_state, new_state)
                 except Exception as e:
                     logger.warning(f"상태 변경 콜백 오류: {e}")
 
@@ -416,12 +704,17 @@ class FixedVoiceFriendlyConversationManager:
             self.callbacks['on_state_change'] = on_state_change
         if on_error:
             self.callbacks['on_error'] = on_error
+        
+        self._cb_user = self.callbacks['on_user_speech']
+        self._cb_ai = self.callbacks['on_ai_response']
+        self._cb_state = self.callbacks['on_state_change']
+        self._cb_err = self.callbacks['on_error']
 
     def get_conversation_status(self) -> Dict[str, Any]:
         """대화 상태 조회"""
         elapsed_time = 0
-        if self.stats['conversation_start_time']:
-            elapsed_time = (datetime.now() - self.stats['conversation_start_time']).total_seconds()
+        if self._start_monotonic is not None:
+            elapsed_time = time.monotonic() - self._start_monotonic
         
         return {
             "state": self.state.value,
@@ -430,7 +723,7 @@ class FixedVoiceFriendlyConversationManager:
             "initialization_complete": self.initialization_complete,
             "elapsed_time": elapsed_time,
             "total_turns": self.stats['total_pipeline_runs'],
-            "avg_response_time": self.stats['avg_pipeline_time'],
+            "avg_response_time": self._avg_pipeline_time(),
             "error_count": self.error_count,
             "stt_errors": self.stats['stt_errors'],
             "ai_errors": self.stats['ai_errors'],
@@ -454,25 +747,36 @@ class FixedVoiceFriendlyConversationManager:
         try:
             self.is_running = False
             self.is_processing = False
+            self._set_state(ConversationState.IDLE)
+            self._input_evt.set()  # 입력 대기 중인 메인 루프 깨우기
             
-            # STT 스레드 정리
-            if self.stt_thread and self.stt_thread.is_alive():
-                logger.info("🎤 STT 스레드 종료 대기...")
-                self.stt_thread.join(timeout=3)
+            for task in (self._greeting_task, self._fallback_task, self._summary_task):
+                if task is not None and not task.done():
+                    task.cancel()
             
-            # STT 클라이언트 정리
-            if self.stt_client and hasattr(self.stt_client, 'stream'):
+            # STT 워커 정리 (재시도 대기 중이면 즉시 깨움, 스트리밍 중이면 스트림 중단)
+            self._shutdown_evt.set()
+            if self.stt_client:
                 try:
-                    self.stt_client.stream.terminate()
+                    self.stt_client.stop()
                 except Exception as e:
-                    logger.debug(f"STT 스트림 종료 오류 (무시됨): {e}")
+                    logger.debug("STT 스트림 종료 오류 (무시됨): %s", e)
             
-            # 큐 정리
-            while not self.stt_queue.empty():
+            if self._stt_future and not self._stt_future.done():
+                logger.info("🎤 STT 워커 종료 대기...")
                 try:
-                    self.stt_queue.get_nowait()
-                except queue.Empty:
-                    break
+                    # 루프를 막지 않고 대기 (shield: 타임아웃이 워커 future를 취소하지 않도록)
+                    await asyncio.wait_for(asyncio.shield(self._stt_future), timeout=3)
+                except asyncio.TimeoutError:
+                    logger.warning("STT 워커가 제시간에 종료되지 않음")
+            
+            if self._stt_executor:
+                self._stt_executor.shutdown(wait=False, cancel_futures=True)
+                self._stt_executor = None
+            self._stt_future = None
+            
+            # 큐 정리
+            self.stt_queue.clear()
             
             # 오디오 매니저 정리
             try:
@@ -497,17 +801,17 @@ class FixedVoiceFriendlyConversationManager:
 
     def _print_final_stats(self):
         """최종 통계 출력"""
-        if self.stats['conversation_start_time']:
-            total_time = (datetime.now() - self.stats['conversation_start_time']).total_seconds()
+        if self._start_monotonic is not None and logger.isEnabledFor(logging.INFO):
+            total_time = time.monotonic() - self._start_monotonic
             
             logger.info("📊 최종 파이프라인 통계:")
-            logger.info(f"   총 시간: {total_time:.1f}초")
-            logger.info(f"   총 파이프라인 실행: {self.stats['total_pipeline_runs']}")
-            logger.info(f"   평균 처리 시간: {self.stats['avg_pipeline_time']:.3f}초")
-            logger.info(f"   초기화 시도: {self.stats['initialization_attempts']}")
-            logger.info(f"   STT 오류: {self.stats['stt_errors']}")
-            logger.info(f"   AI 오류: {self.stats['ai_errors']}")
-            logger.info(f"   TTS 오류: {self.stats['tts_errors']}")
+            logger.info("   총 시간: %.1f초", total_time)
+            logger.info("   총 파이프라인 실행: %d", self.stats['total_pipeline_runs'])
+            logger.info("   평균 처리 시간: %.3f초", self._avg_pipeline_time())
+            logger.info("   초기화 시도: %d", self.stats['initialization_attempts'])
+            logger.info("   STT 오류: %d", self.stats['stt_errors'])
+            logger.info("   AI 오류: %d", self.stats['ai_errors'])
+            logger.info("   TTS 오류: %d", self.stats['tts_errors'])
 
 
 # 하위 호환성
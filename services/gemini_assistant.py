@@ -210,6 +210,26 @@ class OptimizedGeminiAssistant:
             logger.error(f"Gemini 처리 오류: {e}")
             return self._create_fallback_response(user_input, "error")
     
+    async def summarize_conversation(self, transcript: str, max_sentences: int = 3, timeout: float = 3.0) -> str:
+        """상담 대화 요약 (비활성/실패 시 빈 문자열 - 호출자가 폴백 처리)"""
+        
+        if not self.is_enabled or not transcript:
+            return ""
+        
+        prompt = (
+            f"다음 보이스피싱 상담 대화를 피해 상황과 진행된 조치 중심으로 "
+            f"{max_sentences}문장 이내로 요약하세요.\n\n{transcript}"
+        )
+        
+        try:
+            return await asyncio.wait_for(self._call_gemini(prompt), timeout=timeout)
+        except asyncio.TimeoutError:
+            self.stats["timeouts"] += 1
+            logger.warning("Gemini 요약 타임아웃")
+        except Exception as e:
+            logger.warning(f"Gemini 요약 오류: {e}")
+        return ""
+    
     def _classify_situation(self, user_input: str) -> str:
         """상황 분류"""
         
@@ -4,10 +4,165 @@
 """
 
 import logging
-from typing import List, Dict, Any
+import re
+from functools import lru_cache
+from time import perf_counter_ns as _now_ns
+from typing import List, Dict, Any, Optional
 
 logger = logging.getLogger(__name__)
 
+# 감지기별 (구문, 가중치) - 구문이 입력에 있으면 한 번만 가산
+_DETECTOR_PHRASES = {
+    "context": [
+        # 명확한 반박 표현만 감지
+        ("말고", 0.4), ("아니라", 0.4), ("다른거로", 0.4), ("그런게 아니라", 0.4)
+    ],
+    "explanation": [
+        # 명확한 질문 패턴만
+        ("뭐예요", 0.5), ("무엇인가요", 0.5), ("어떤 건가요", 0.5), ("설명해주세요", 0.5),
+        ("어디예요", 0.5), ("누구예요", 0.5), ("언제예요", 0.5), ("왜 그런가요", 0.5),
+        ("어떻게 하는 건가요", 0.5), ("무슨 뜻인가요", 0.5)
+    ],
+    "dissatisfaction": [
+        # 강한 불만족 표현만
+        ("정말 도움 안", 0.4), ("진짜 모르겠", 0.4), ("이해 못하겠", 0.4),
+        ("별로 도움", 0.4), ("그런게 아니라", 0.4), ("제대로 알려", 0.4),
+        # 연속된 "아니" 또는 "다시"
+        ("아니 아니", 0.5), ("다시 다시", 0.5), ("아니 그런게", 0.5)
+    ],
+    "complexity": [
+        # 복잡성 연결어 (강한 것들만)
+        ("그런데 또", 0.4), ("하지만 추가로", 0.4), ("그리고 만약에", 0.4)
+    ]
+}
+
+# 구문 -> [(감지기, 가중치)] (같은 구문이 여러 감지기에 속할 수 있음)
+_PHRASE_TARGETS: Dict[str, List[tuple]] = {}
+for _detector, _phrases in _DETECTOR_PHRASES.items():
+    for _phrase, _weight in _phrases:
+        _PHRASE_TARGETS.setdefault(_phrase, []).append((_detector, _weight))
+
+# 모든 구문을 하나의 alternation으로 컴파일 (lookahead로 겹치는 위치도 검사)
+# 어떤 구문도 다른 구문의 접두사가 아니므로 위치별 최장 일치만으로 전체 구문 집합이 나옴
+_PHRASE_PATTERN = re.compile(
+    "(?=(" + "|".join(re.escape(p) for p in sorted(_PHRASE_TARGETS, key=len, reverse=True)) + "))"
+)
+
+def _scan_phrase_scores(user_input: str) -> Dict[str, float]:
+    """입력을 한 번만 훑어 감지기별 구문 가중치 합계 반환"""
+    scores = dict.fromkeys(_DETECTOR_PHRASES, 0.0)
+    for phrase in {m.group(1) for m in _PHRASE_PATTERN.finditer(user_input)}:
+        for detector, weight in _PHRASE_TARGETS[phrase]:
+            scores[detector] += weight
+    return scores
+
+# 🎙️ 음성 입력 특성 (정확히 일치하는지만 보므로 frozenset)
+_SHORT_RESPONSES = frozenset({"네", "예", "아니", "싫어", "안해", "응", "어", "음"})
+_INCOMPLETE_SPEECH = frozenset({"어", "음", "그", "이", "아"})
+
+# 룰 기반으로 처리 가능한 패턴들 (확장)
+_RULE_PATTERNS = {
+    "emergency_keywords": ("돈", "송금", "보냈", "이체", "급해", "사기", "당했", "피해", "도둑"),
+    "help_requests": ("도와", "도움", "알려", "방법", "해야", "어떻게"),
+    "yes_no": ("네", "예", "아니", "싫어", "안해", "응", "좋아", "맞아"),
+    "simple_questions": ("뭐예요", "어디예요", "언제", "얼마", "누구"),
+    "contact_requests": ("132", "1811", "번호", "연락", "전화")
+}
+
+# Gemini가 필요한 상황들 (음성 맞춤)
+_GEMINI_TRIGGERS = {
+    "context_mismatch": (
+        "말고", "아니라", "다른거", "또 다른", "추가로", "그리고",
+        "구체적으로", "자세히", "더 자세히"
+    ),
+    "explanation_needed": (
+        "뭐예요", "무엇", "어떤", "설명해", "의미", "뜻이",
+        "어디예요", "누구예요", "언제예요", "왜", "어떻게",
+        "몰라서", "모르겠어서", "이해가 안돼서"
+    ),
+    "dissatisfaction": (
+        "아니 그런게", "정말 도움 안", "진짜 모르겠", "제대로 알려",
+        "이해 못하겠", "헷갈려서", "더 쉽게", "간단하게",
+        "별로 도움", "그런게 아니라"
+    ),
+    "complex_situation": (
+        "그런데 또", "하지만 추가로", "그리고 만약에", "복잡한 상황",
+        "여러 가지", "동시에", "한번에"
+    )
+}
+
+# 즉시 룰 기반 / 폴백 판단용 키워드
+_IMMEDIATE_EMERGENCY_WORDS = ("급해", "당했어", "돈 보냈어", "사기")
+_IMMEDIATE_CONTACT_WORDS = ("132번", "1811번", "전화번호")
+_FALLBACK_EMERGENCY_WORDS = ("돈", "송금", "급해", "사기", "당했")
+_FALLBACK_CONTACT_WORDS = ("132", "1811", "번호", "연락", "전화")
+_FALLBACK_HELP_WORDS = ("도와", "도움", "알려", "방법")
+
+# 음성 인식 오류 교정 (간단한 것들 - 한 번의 정규식 스캔으로 모두 치환)
+_VOICE_CORRECTIONS = {
+    "일삼이": "132",
+    "일팔일일": "1811",
+    "보이스비싱": "보이스피싱",
+    "예방설정": "예방 설정"
+}
+_VOICE_CORRECTION_PATTERN = re.compile("|".join(map(re.escape, _VOICE_CORRECTIONS)))
+
+@lru_cache(maxsize=256)
+def _preprocess_voice_text(user_input: str) -> str:
+    """음성 입력 정리 + 소문자화 (같은 발화가 반복되는 경우가 많아 결과 캐시)"""
+    return _VOICE_CORRECTION_PATTERN.sub(lambda m: _VOICE_CORRECTIONS[m.group(0)], user_input.strip().lower())
+
+# 감지기 간 동시 출현 조건에 쓰이는 토큰 비트 (한 번의 스캔으로 플래그 계산)
+_BIT_132 = 1 << 0
+_BIT_1811 = 1 << 1
+_BIT_WHAT = 1 << 2            # "뭐"
+_BIT_HOW_TO = 1 << 3          # "어떻게 해야"
+_BIT_PREVENTION = 1 << 4      # "예방"
+_BIT_NOT_PREVENTION = 1 << 5  # "예방 말고"
+_BIT_SETTING = 1 << 6         # "설정"
+_BIT_METHOD = 1 << 7          # "방법"
+
+_TOKEN_BITS = {
+    "132": _BIT_132,
+    "1811": _BIT_1811,
+    "뭐": _BIT_WHAT,
+    "어떻게 해야": _BIT_HOW_TO,
+    "예방": _BIT_PREVENTION,
+    # "예방"이 접두사라 같은 위치에서는 긴 토큰만 잡히므로 두 비트 모두 설정
+    "예방 말고": _BIT_NOT_PREVENTION | _BIT_PREVENTION,
+    "설정": _BIT_SETTING,
+    "방법": _BIT_METHOD
+}
+
+_TOKEN_PATTERN = re.compile(
+    "(?=(" + "|".join(re.escape(t) for t in sorted(_TOKEN_BITS, key=len, reverse=True)) + "))"
+)
+
+# 반복 질문 감지용 핵심 키워드
+_REPETITION_WORDS = (
+    ("132", _BIT_132), ("1811", _BIT_1811), ("설정", _BIT_SETTING),
+    ("예방", _BIT_PREVENTION), ("방법", _BIT_METHOD)
+)
+
+def _scan_token_flags(user_input: str) -> int:
+    """입력을 한 번만 훑어 등장한 토큰의 비트 OR 반환"""
+    flags = 0
+    for m in _TOKEN_PATTERN.finditer(user_input):
+        flags |= _TOKEN_BITS[m.group(1)]
+    return flags
+
+def _has_at_least_two(text: str, markers: tuple) -> bool:
+    """표식이 합쳐서 2번 이상 나오는지 (정확한 개수 없이 두 번째 발견 시 바로 반환)"""
+    found = 0
+    for marker in markers:
+        index = text.find(marker)
+        while index >= 0:
+            found += 1
+            if found >= 2:
+                return True
+            index = text.find(marker, index + len(marker))
+    return False
+
 class HybridDecisionEngine:
     """
     언제 Gemini를 쓸지 판단하는 엔진 - 음성 대화 최적화
@@ -19,21 +174,15 @@ class HybridDecisionEngine:
     def __init__(self, debug: bool = True):
         self.debug = debug
         
-        # 🎙️ 음성 입력 특성 반영
+        # 🎙️ 음성 입력 특성 반영 (고정 패턴은 모듈 상수 공유)
         self.voice_patterns = {
-            "short_responses": ["네", "예", "아니", "싫어", "안해", "응", "어", "음"],
-            "incomplete_speech": ["어", "음", "그", "이", "아"],
+            "short_responses": _SHORT_RESPONSES,
+            "incomplete_speech": _INCOMPLETE_SPEECH,
             "repeated_words": []  # 동적으로 추가됨
         }
         
         # 룰 기반으로 처리 가능한 패턴들 (확장)
-        self.rule_patterns = {
-            "emergency_keywords": ["돈", "송금", "보냈", "이체", "급해", "사기", "당했", "피해", "도둑"],
-            "help_requests": ["도와", "도움", "알려", "방법", "해야", "어떻게"],
-            "yes_no": ["네", "예", "아니", "싫어", "안해", "응", "좋아", "맞아"],
-            "simple_questions": ["뭐예요", "어디예요", "언제", "얼마", "누구"],
-            "contact_requests": ["132", "1811", "번호", "연락", "전화"]
-        }
+        self.rule_patterns = _RULE_PATTERNS
         
         # 🔧 음성 친화적 임계값 (기존보다 더 보수적)
         self.thresholds = {
@@ -45,26 +194,7 @@ class HybridDecisionEngine:
         }
         
         # Gemini가 필요한 상황들 (음성 맞춤)
-        self.gemini_triggers = {
-            "context_mismatch": [
-                "말고", "아니라", "다른거", "또 다른", "추가로", "그리고",
-                "구체적으로", "자세히", "더 자세히"
-            ],
-            "explanation_needed": [
-                "뭐예요", "무엇", "어떤", "설명해", "의미", "뜻이",
-                "어디예요", "누구예요", "언제예요", "왜", "어떻게",
-                "몰라서", "모르겠어서", "이해가 안돼서"
-            ],
-            "dissatisfaction": [
-                "아니 그런게", "정말 도움 안", "진짜 모르겠", "제대로 알려",
-                "이해 못하겠", "헷갈려서", "더 쉽게", "간단하게",
-                "별로 도움", "그런게 아니라"
-            ],
-            "complex_situation": [
-                "그런데 또", "하지만 추가로", "그리고 만약에", "복잡한 상황",
-                "여러 가지", "동시에", "한번에"
-            ]
-        }
+        self.gemini_triggers = _GEMINI_TRIGGERS
         
         # 성능 모니터링
         self.stats = {
@@ -73,6 +203,7 @@ class HybridDecisionEngine:
             "rule_based_calls": 0,
             "avg_decision_time": 0.0
         }
+        self._decision_time_total_ns = 0  # 평균 계산용 누적 시간 (정수 ns)
         
         if self.debug:
             print("✅ 음성 친화적 하이브리드 엔진 초기화")
@@ -91,8 +222,7 @@ class HybridDecisionEngine:
             }
         """
         
-        import time
-        start_time = time.time()
+        start_ns = _now_ns()
         
         self.stats["total_decisions"] += 1
         
@@ -106,50 +236,50 @@ class HybridDecisionEngine:
         # 🎙️ 음성 입력 전처리
         processed_input = self._preprocess_voice_input(user_input)
         
-        if self.debug:
-            print(f"🔍 하이브리드 판단: '{processed_input}'")
+        logger.debug("🔍 하이브리드 판단: '%s'", processed_input)
         
         # 🚫 음성 특성상 즉시 룰 기반 처리해야 하는 경우들
         if self._should_use_rules_immediately(processed_input):
             decision["fallback_rule"] = self._suggest_rule_fallback(processed_input)
             decision["confidence"] = 0.1  # 매우 낮은 신뢰도
             
-            if self.debug:
-                print(f"⚡ 즉시 룰 기반: {decision['fallback_rule']}")
+            logger.debug("⚡ 즉시 룰 기반: %s", decision["fallback_rule"])
             
             self.stats["rule_based_calls"] += 1
-            self._update_decision_time(start_time)
+            self._update_decision_time(start_ns)
             return decision
         
-        # 🔍 Gemini 필요성 분석
+        # 🔍 Gemini 필요성 분석 (구문 매칭은 한 번의 스캔으로 모든 감지기에 공유)
         scores = {}
+        phrase_scores = _scan_phrase_scores(processed_input)
+        token_flags = _scan_token_flags(processed_input)
         
         # 1. 컨텍스트 불일치 감지
-        scores["context"] = self._detect_context_mismatch(processed_input, last_ai_response)
+        scores["context"] = self._detect_context_mismatch(processed_input, last_ai_response, phrase_scores, token_flags)
         if scores["context"] > self.thresholds["context_mismatch"]:
             decision["use_gemini"] = True
             decision["reasons"].append(f"컨텍스트 불일치 ({scores['context']:.2f})")
         
         # 2. 설명 요청 감지
-        scores["explanation"] = self._detect_explanation_request(processed_input)
+        scores["explanation"] = self._detect_explanation_request(processed_input, phrase_scores, token_flags)
         if scores["explanation"] > self.thresholds["explanation_needed"]:
             decision["use_gemini"] = True
             decision["reasons"].append(f"설명 요청 ({scores['explanation']:.2f})")
         
         # 3. 사용자 불만족 감지
-        scores["dissatisfaction"] = self._detect_dissatisfaction(processed_input, conversation_history)
+        scores["dissatisfaction"] = self._detect_dissatisfaction(processed_input, conversation_history, phrase_scores)
         if scores["dissatisfaction"] > self.thresholds["dissatisfaction"]:
             decision["use_gemini"] = True
             decision["reasons"].append(f"사용자 불만족 ({scores['dissatisfaction']:.2f})")
         
         # 4. 반복 질문 감지
-        scores["repetition"] = self._detect_repetition(processed_input, conversation_history)
+        scores["repetition"] = self._detect_repetition(processed_input, conversation_history, token_flags)
         if scores["repetition"] > self.thresholds["repetition"]:
             decision["use_gemini"] = True
             decision["reasons"].append(f"반복 질문 ({scores['repetition']:.2f})")
         
         # 5. 복잡한 상황 감지
-        scores["complexity"] = self._detect_complexity(processed_input)
+        scores["complexity"] = self._detect_complexity(processed_input, phrase_scores)
         if scores["complexity"] > self.thresholds["complexity"]:
             decision["use_gemini"] = True
             decision["reasons"].append(f"복잡한 상황 ({scores['complexity']:.2f})")
@@ -164,13 +294,13 @@ class HybridDecisionEngine:
         else:
             self.stats["gemini_calls"] += 1
         
-        if self.debug:
+        if logger.isEnabledFor(logging.DEBUG):
             action = "Gemini 호출" if decision["use_gemini"] else "룰 기반"
-            print(f"🎯 결정: {action} (신뢰도: {decision['confidence']:.2f})")
+            logger.debug("🎯 결정: %s (신뢰도: %.2f)", action, decision["confidence"])
             if decision["reasons"]:
-                print(f"   이유: {', '.join(decision['reasons'])}")
+                logger.debug("   이유: %s", ", ".join(decision["reasons"]))
         
-        self._update_decision_time(start_time)
+        self._update_decision_time(start_ns)
         return decision
     
     def _preprocess_voice_input(self, user_input: str) -> str:
@@ -178,21 +308,8 @@ class HybridDecisionEngine:
         if not user_input:
             return ""
         
-        # 기본 정리
-        processed = user_input.strip().lower()
-        
-        # 음성 인식 오류 교정 (간단한 것들)
-        corrections = {
-            "일삼이": "132",
-            "일팔일일": "1811",
-            "보이스비싱": "보이스피싱",
-            "예방설정": "예방 설정"
-        }
-        
-        for wrong, correct in corrections.items():
-            processed = processed.replace(wrong, correct)
-        
-        return processed
+        # 기본 정리 + 오류 교정 (소문자화는 여기서 한 번만, 이후 감지기는 결과를 공유)
+        return _preprocess_voice_text(user_input)
     
     def _should_use_rules_immediately(self, user_input: str) -> bool:
         """음성 특성상 즉시 룰 기반 처리해야 하는 경우"""
@@ -210,29 +327,25 @@ class HybridDecisionEngine:
             return True
         
         # 4. 명확한 긴급 상황
-        emergency_words = ["급해", "당했어", "돈 보냈어", "사기"]
-        if any(word in user_input for word in emergency_words):
+        if any(word in user_input for word in _IMMEDIATE_EMERGENCY_WORDS):
             return True
         
         # 5. 명확한 연락처 요청
-        if any(word in user_input for word in ["132번", "1811번", "전화번호"]):
+        if any(word in user_input for word in _IMMEDIATE_CONTACT_WORDS):
             return True
         
         return False
     
-    def _detect_context_mismatch(self, user_input: str, last_ai_response: str) -> float:
+    def _detect_context_mismatch(self, user_input: str, last_ai_response: str,
+                                 phrase_scores: Optional[Dict[str, float]] = None,
+                                 token_flags: Optional[int] = None) -> float:
         """컨텍스트 불일치 감지 - 음성 버전"""
         
         if not last_ai_response:
             return 0.0
         
-        score = 0.0
-        
-        # 명확한 반박 표현만 감지
-        strong_contradictions = ["말고", "아니라", "다른거로", "그런게 아니라"]
-        for phrase in strong_contradictions:
-            if phrase in user_input:
-                score += 0.4
+        # 명확한 반박 표현 (공유 스캔 결과)
+        score = (phrase_scores or _scan_phrase_scores(user_input))["context"]
         
         # AI가 질문했는데 완전히 다른 답변
         if "?" in last_ai_response:
@@ -242,61 +355,44 @@ class HybridDecisionEngine:
                     score += 0.3
         
         # 예방 vs 사후 대처 같은 명확한 대조
-        if "예방" in last_ai_response and "예방 말고" in user_input:
+        if token_flags is None:
+            token_flags = _scan_token_flags(user_input)
+        if "예방" in last_ai_response and token_flags & _BIT_NOT_PREVENTION:
             score += 0.5
         
         return min(score, 1.0)
     
-    def _detect_explanation_request(self, user_input: str) -> float:
+    def _detect_explanation_request(self, user_input: str,
+                                    phrase_scores: Optional[Dict[str, float]] = None,
+                                    token_flags: Optional[int] = None) -> float:
         """설명 요청 감지 - 더 엄격하게"""
         
-        score = 0.0
-        
-        # 명확한 질문 패턴만
-        clear_questions = [
-            "뭐예요", "무엇인가요", "어떤 건가요", "설명해주세요",
-            "어디예요", "누구예요", "언제예요", "왜 그런가요",
-            "어떻게 하는 건가요", "무슨 뜻인가요"
-        ]
-        
-        for question in clear_questions:
-            if question in user_input:
-                score += 0.5
+        # 명확한 질문 패턴 (공유 스캔 결과)
+        score = (phrase_scores or _scan_phrase_scores(user_input))["explanation"]
+        if token_flags is None:
+            token_flags = _scan_token_flags(user_input)
         
         # "132번이 뭐예요?" 같은 구체적 질문
-        if any(num in user_input for num in ["132", "1811"]) and "뭐" in user_input:
+        if token_flags & (_BIT_132 | _BIT_1811) and token_flags & _BIT_WHAT:
             score += 0.4
         
         # "어떻게 해야" + 구체적 행동
-        if "어떻게 해야" in user_input and len(user_input) > 15:
+        if token_flags & _BIT_HOW_TO and len(user_input) > 15:
             score += 0.3
         
         return min(score, 1.0)
     
-    def _detect_dissatisfaction(self, user_input: str, conversation_history: List[Dict]) -> float:
+    def _detect_dissatisfaction(self, user_input: str, conversation_history: List[Dict],
+                                phrase_scores: Optional[Dict[str, float]] = None) -> float:
         """사용자 불만족 감지 - 강한 불만만"""
         
-        score = 0.0
-        
-        # 강한 불만족 표현만
-        strong_dissatisfaction = [
-            "정말 도움 안", "진짜 모르겠", "이해 못하겠",
-            "별로 도움", "그런게 아니라", "제대로 알려"
-        ]
-        
-        for phrase in strong_dissatisfaction:
-            if phrase in user_input:
-                score += 0.4
-        
-        # 연속된 "아니" 또는 "다시"
-        repeated_no = ["아니 아니", "다시 다시", "아니 그런게"]
-        for phrase in repeated_no:
-            if phrase in user_input:
-                score += 0.5
+        # 강한 불만족 표현 + 연속된 "아니"/"다시" (공유 스캔 결과)
+        score = (phrase_scores or _scan_phrase_scores(user_input))["dissatisfaction"]
         
         return min(score, 1.0)
     
-    def _detect_repetition(self, user_input: str, conversation_history: List[Dict]) -> float:
+    def _detect_repetition(self, user_input: str, conversation_history: List[Dict],
+                           token_flags: Optional[int] = None) -> float:
         """반복 질문 감지 - 명확한 반복만"""
         
         if len(conversation_history) < 4:  # 2 → 4 (더 긴 히스토리 필요)
@@ -312,33 +408,29 @@ class HybridDecisionEngine:
         ]
         
         # 동일한 핵심 키워드 3번 이상 반복
-        key_words = ["132", "1811", "설정", "예방", "방법"]
-        for word in key_words:
-            if word in user_input:
+        if token_flags is None:
+            token_flags = _scan_token_flags(user_input)
+        for word, bit in _REPETITION_WORDS:
+            if token_flags & bit:
                 count = sum(1 for msg in recent_user_messages if word in msg)
                 if count >= 3:
                     score += 0.4
         
         return min(score, 1.0)
     
-    def _detect_complexity(self, user_input: str) -> float:
+    def _detect_complexity(self, user_input: str,
+                           phrase_scores: Optional[Dict[str, float]] = None) -> float:
         """복잡한 상황 감지 - 매우 복잡한 경우만"""
         
-        score = 0.0
+        # 복잡성 연결어 (공유 스캔 결과)
+        score = (phrase_scores or _scan_phrase_scores(user_input))["complexity"]
         
         # 매우 긴 문장 (70자 이상)
         if len(user_input) > 70:
             score += 0.3
         
-        # 복잡성 연결어 (강한 것들만)
-        strong_complexity = ["그런데 또", "하지만 추가로", "그리고 만약에"]
-        for phrase in strong_complexity:
-            if phrase in user_input:
-                score += 0.4
-        
         # 다중 질문
-        question_count = user_input.count("?") + user_input.count("까요")
-        if question_count >= 2:
+        if _has_at_least_two(user_input, ("?", "까요")):
             score += 0.3
         
         return min(score, 1.0)
@@ -347,15 +439,15 @@ class HybridDecisionEngine:
         """룰 기반 폴백 제안 - 음성 최적화"""
         
         # 긴급 키워드 우선
-        if any(word in user_input for word in ["돈", "송금", "급해", "사기", "당했"]):
+        if any(word in user_input for word in _FALLBACK_EMERGENCY_WORDS):
             return "emergency_response"
         
         # 연락처 문의
-        if any(word in user_input for word in ["132", "1811", "번호", "연락", "전화"]):
+        if any(word in user_input for word in _FALLBACK_CONTACT_WORDS):
             return "contact_info"
         
         # 도움 요청
-        if any(word in user_input for word in ["도와", "도움", "알려", "방법"]):
+        if any(word in user_input for word in _FALLBACK_HELP_WORDS):
             return "help_guidance"
         
         # 단순 응답
@@ -364,17 +456,9 @@ class HybridDecisionEngine:
         
         return "general_guidance"
     
-    def _update_decision_time(self, start_time: float):
-        """의사결정 시간 업데이트"""
-        import time
-        decision_time = time.time() - start_time
-        
-        current_avg = self.stats["avg_decision_time"]
-        total_decisions = self.stats["total_decisions"]
-        
-        self.stats["avg_decision_time"] = (
-            (current_avg * (total_decisions - 1) + decision_time) / total_decisions
-        )
+    def _update_decision_time(self, start_ns: int):
+        """의사결정 시간 누적 (정수 ns 덧셈만 - 평균은 통계 조회 시 계산)"""
+        self._decision_time_total_ns += _now_ns() - start_ns
     
     def get_performance_stats(self) -> Dict[str, Any]:
         """성능 통계 조회"""
@@ -383,6 +467,9 @@ class HybridDecisionEngine:
         if total == 0:
             return self.stats
         
+        # 평균 결정 시간 (초) - 누적 ns 합에서 조회 시점에 계산
+        self.stats["avg_decision_time"] = self._decision_time_total_ns / total / 1e9
+        
         gemini_rate = (self.stats["gemini_calls"] / total) * 100
         rule_rate = (self.stats["rule_based_calls"] / total) * 100
         
@@ -188,6 +188,7 @@ class RTZROpenAPIClient:
 
         self._sess = Session()
         self._token = None
+        self._stop_event = threading.Event()
 
     def reset_stream(self):
         self.stream = MicrophoneStream(SAMPLE_RATE, CHUNK, CHANNELS, FORMAT)
@@ -206,6 +207,16 @@ class RTZROpenAPIClient:
             self._token = resp.json()
         return self._token["access_token"]
 
+    def stop(self):
+        """
+        스트리밍 중단 요청 메소드. 현재 마이크 스트림을 닫아 진행 중인 Decode 세션을 끝내고,
+        transcribe_streaming_grpc 루프가 새 세션을 열지 않고 종료되도록 한다.
+        """
+        self._stop_event.set()
+        stream = getattr(self, 'stream', None)
+        if stream is not None and not stream.closed:
+            stream.terminate()
+
     def print_transcript(self, start_time, transcript, is_final=False):
         clear_line_escape = "\033[K"  # clear line Escape Sequence
         if not is_final:
@@ -239,7 +250,7 @@ class RTZROpenAPIClient:
             }
 
             global_st_time = time.time()
-            while True:
+            while not self._stop_event.is_set():
                 keyword_idx = not keyword_idx
 
                 req_iter = req_iterator(keywords=keywords[keyword_idx])
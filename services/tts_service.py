@@ -18,6 +18,10 @@ from config.settings import settings
 
 logger = logging.getLogger(__name__)
 
+# 점진적 청크 크기: 첫 청크는 작게 바로 내보내고 이후 두 배씩 키움 (상한까지)
+_STREAM_FIRST_CHUNK = 2048
+_STREAM_MAX_CHUNK = 32768
+
 class VoiceFriendlyTTSService:
     """
     음성 친화적 TTS 서비스 - 수정된 안정 버전
@@ -73,7 +77,8 @@ class VoiceFriendlyTTSService:
             'total_requests': 0,
             'fast_responses': 0,
             'timeouts': 0,
-            'avg_response_time': 0.0
+            'timed_responses': 0,
+            'total_response_time': 0.0  # 누적 응답시간 (평균은 조회 시 계산)
         }
         
         # 음성 변환 규칙
@@ -304,14 +309,16 @@ class VoiceFriendlyTTSService:
             yield b''
             return
         
-        # 작은 청크로 빠른 스트리밍
-        chunk_size = 2048
+        # 점진적 청크 스트리밍 (memoryview 슬라이스 - 청크마다 bytes 복사 없음)
+        chunk_size = _STREAM_FIRST_CHUNK
+        view = memoryview(audio_data)
+        pos = 0
         
-        for i in range(0, len(audio_data), chunk_size):
-            chunk = audio_data[i:i + chunk_size]
-            if chunk:
-                yield chunk
-                await asyncio.sleep(0.001)
+        while pos < len(view):
+            yield view[pos:pos + chunk_size]
+            pos += chunk_size
+            chunk_size = min(chunk_size * 2, _STREAM_MAX_CHUNK)
+            await asyncio.sleep(0)  # 고정 대기 없이 이벤트 루프에 양보만
 
     def _generate_simple_cache_key(self, text: str) -> str:
         """간단한 캐시 키 생성"""
@@ -329,12 +336,8 @@ class VoiceFriendlyTTSService:
     def _update_response_time(self, response_time: float):
         """응답 시간 통계 업데이트"""
         
-        current_avg = self.stats['avg_response_time']
-        total_requests = self.stats['total_requests']
-        
-        self.stats['avg_response_time'] = (
-            (current_avg * (total_requests - 1) + response_time) / total_requests
-        )
+        self.stats['timed_responses'] += 1
+        self.stats['total_response_time'] += response_time
 
     async def text_to_speech_file(self, text: str) -> bytes:
         """파일 방식 TTS (호환성용)"""
@@ -380,12 +383,14 @@ class VoiceFriendlyTTSService:
         total = self.stats['total_requests']
         fast_rate = (self.stats['fast_responses'] / total * 100) if total > 0 else 0
         timeout_rate = (self.stats['timeouts'] / total * 100) if total > 0 else 0
+        timed = self.stats['timed_responses']
+        avg_response_time = self.stats['total_response_time'] / timed if timed else 0.0
         
         return {
             'total_requests': total,
             'fast_response_rate': f"{fast_rate:.1f}%",
             'timeout_rate': f"{timeout_rate:.1f}%",
-            'avg_response_time': f"{self.stats['avg_response_time']:.3f}초",
+            'avg_response_time': f"{avg_response_time:.3f}초",
             'cache_size': len(self.simple_cache),
             'is_enabled': self.is_enabled
         }